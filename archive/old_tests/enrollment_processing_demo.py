@@ -126,24 +126,21 @@ print("=" * 60)
 
 try:
     if 'all_results' in locals():
-        # Create consolidated summary across all facilities
-        all_summaries = []
-
-        for sheet_name, result in all_results.items():
-            if result is not None:
-                enriched, full_summary, filtered_summary = result
-                # Add sheet identifier
-                full_summary['source_sheet'] = sheet_name
-                all_summaries.append(full_summary)
-
-        if all_summaries:
-            consolidated_summary = pd.concat(all_summaries, ignore_index=True)
+        # Create consolidated summary across all facilities - concat once,
+        # with the sheet name carried in as the outer key
+        frames = {sheet_name: result[1] for sheet_name, result in all_results.items() if result is not None}
+
+        if frames:
+            consolidated_summary = (pd.concat(frames, names=['source_sheet'])
+                                    .reset_index(level='source_sheet')
+                                    .reset_index(drop=True))
             consolidated_summary.to_csv('consolidated_enrollment_summary.csv', index=False)
             print(f"Consolidated summary exported: {len(consolidated_summary)} records")
 
             # Show top facilities by contract count
             if 'contract_count' in consolidated_summary.columns:
-                top_facilities = consolidated_summary.groupby('facility_name')['contract_count'].sum().sort_values(ascending=False).head(10)
+                consolidated_summary['facility_name'] = consolidated_summary['facility_name'].astype('category')
+                top_facilities = consolidated_summary.groupby('facility_name', observed=True)['contract_count'].sum().sort_values(ascending=False).head(10)
                 print("\nTop 10 Facilities by Contract Count:")
                 print(top_facilities)
 
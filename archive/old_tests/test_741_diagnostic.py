@@ -6,92 +6,116 @@ Shows exactly where rows are being dropped
 import pandas as pd
 import numpy as np
 
+# Facilities known to the simulated pipeline
+LOCATION_MAP = {
+    'H3170': 'San Dimas',
+    'H3330': 'Lower Bucks',
+    'H3270': 'Centinela'
+}
+
+def map_locations(client_ids, strip=False):
+    """
+    Look up facility names per distinct CLIENT ID and gather them by category code
+    """
+    client_ids = client_ids.astype('category')
+    keys = client_ids.cat.categories.str.strip() if strip else client_ids.cat.categories
+    # Trailing UNKNOWN is picked up by code -1 (missing CLIENT ID)
+    lut = np.array([LOCATION_MAP.get(key, 'UNKNOWN') for key in keys] + ['UNKNOWN'], dtype=object)
+    return lut[client_ids.cat.codes.to_numpy()]
+
+# Raw BEN CODE variants (separators collapsed to spaces) -> 4-tier label
+TIER_VARIANTS = {
+    'EE Only': ['EMP', 'EE', 'EE ONLY', 'EMPLOYEE', 'EMPLOYEE ONLY', 'SELF', 'E'],
+    'EE+Spouse': ['ESP', 'EE SPOUSE', 'EMPLOYEE SPOUSE', 'ES', 'E S'],
+    'EE+Child(ren)': ['ECH', 'E1D', 'EE CHILD', 'EE CHILDREN', 'EMPLOYEE CHILD',
+                      'EMPLOYEE CHILDREN', 'EC', 'E C'],
+    'EE+Family': ['FAM', 'FAMILY', 'EE FAMILY', 'EMPLOYEE FAMILY', 'EF', 'E F']
+}
+TIER_LOOKUP = {variant: tier for tier, variants in TIER_VARIANTS.items() for variant in variants}
+TIERS = list(TIER_VARIANTS) + ['UNKNOWN']
+
+def normalize_tier(raw_tier):
+    """
+    Collapse one raw BEN CODE variant to its 4-tier label, or UNKNOWN
+    """
+    tier_str = str(raw_tier).strip().upper().replace('+', ' ').replace('&', ' ')
+    return TIER_LOOKUP.get(' '.join(tier_str.split()), 'UNKNOWN')
+
+def normalize_tiers(ben_codes):
+    """
+    Normalize each distinct BEN CODE once and gather the labels by category code
+    """
+    ben_codes = ben_codes.astype('category')
+    # Trailing UNKNOWN is picked up by code -1 (missing BEN CODE)
+    lut = np.array([normalize_tier(code) for code in ben_codes.cat.categories] + ['UNKNOWN'], dtype=object)
+    return pd.Categorical(lut[ben_codes.cat.codes.to_numpy()], categories=TIERS)
+
+TEST_COLUMNS = ['CLIENT ID', 'RELATION', 'STATUS', 'BEN CODE', 'PLAN', 'EMPLOYEE NAME']
+
+def _rows(n, columns):
+    """
+    One group of synthetic rows as column arrays; scalar values repeat n times
+    """
+    return {col: np.array(val, dtype=object) if isinstance(val, list) else np.full(n, val, dtype=object)
+            for col, val in columns.items()}
+
 def create_test_data_with_issues():
     """
     Create test data that simulates common row loss scenarios
     """
-    test_data = []
-    
-    # Good rows - San Dimas with proper tiers
-    for i in range(10):
-        test_data.append({
-            'CLIENT ID': 'H3170',
-            'RELATION': 'SELF',
-            'STATUS': 'A',
-            'BEN CODE': ['EMP', 'ESP', 'E1D', 'ECH', 'FAM'][i % 5],
-            'PLAN': 'PRIMEMMEPOLE',
-            'EMPLOYEE NAME': f'Employee_{i}'
-        })
-    
-    # Rows that might get dropped - various STATUS values
     problematic_statuses = ['ACTIVE', 'Act', 'a', 'I', 'INACTIVE', 'T', '1', 'Y']
-    for i, status in enumerate(problematic_statuses):
-        test_data.append({
-            'CLIENT ID': 'H3330',
-            'RELATION': 'SELF',
-            'STATUS': status,
-            'BEN CODE': 'EMP',
-            'PLAN': 'PRIMEMMLB',
-            'EMPLOYEE NAME': f'Status_Issue_{i}'
-        })
-    
-    # Rows that might get dropped - various RELATION values
     problematic_relations = ['EE', 'EMPLOYEE', 'SUBSCRIBER', 'S', 'SPOUSE', 'CHILD', 'self', 'Self']
-    for i, relation in enumerate(problematic_relations):
-        test_data.append({
-            'CLIENT ID': 'H3330',
-            'RELATION': relation,
-            'STATUS': 'A',
-            'BEN CODE': 'ESP',
-            'PLAN': 'PRIMEMMLKEP1',
-            'EMPLOYEE NAME': f'Relation_Issue_{i}'
-        })
-    
-    # Rows with unmapped CLIENT IDs
-    for i in range(5):
-        test_data.append({
-            'CLIENT ID': f'UNKNOWN_{i}',
-            'RELATION': 'SELF',
-            'STATUS': 'A',
-            'BEN CODE': 'FAM',
-            'PLAN': 'PRIMEMMEPOLE',
-            'EMPLOYEE NAME': f'Unknown_Facility_{i}'
-        })
-    
-    # Rows with unusual tier codes
     unusual_tiers = ['EMPLOYEE ONLY', 'EE + SPOUSE', 'EMPLOYEE+CHILD', 'E+F', 'SOMETHING']
-    for i, tier in enumerate(unusual_tiers):
-        test_data.append({
-            'CLIENT ID': 'H3270',
-            'RELATION': 'SELF',
-            'STATUS': 'A',
-            'BEN CODE': tier,
-            'PLAN': 'PRIMEMMEPOCEN',
-            'EMPLOYEE NAME': f'Tier_Issue_{i}'
-        })
+    ben_cycle = ['EMP', 'ESP', 'E1D', 'ECH', 'FAM']
     
-    # Rows with spaces in keys
-    test_data.append({
-        'CLIENT ID': ' H3170 ',  # Leading/trailing spaces
-        'RELATION': ' SELF ',
-        'STATUS': ' A ',
-        'BEN CODE': 'EMP',
-        'PLAN': ' PRIMEMMEPOLE ',
-        'EMPLOYEE NAME': 'Spaces_In_Keys'
-    })
-    
-    # Add some dependents that should be filtered
-    for i in range(10):
-        test_data.append({
-            'CLIENT ID': 'H3170',
-            'RELATION': 'SPOUSE',
-            'STATUS': 'A',
-            'BEN CODE': None,
+    groups = [
+        # Good rows - San Dimas with proper tiers
+        _rows(10, {
+            'CLIENT ID': 'H3170', 'RELATION': 'SELF', 'STATUS': 'A',
+            'BEN CODE': [ben_cycle[i % 5] for i in range(10)],
             'PLAN': 'PRIMEMMEPOLE',
-            'EMPLOYEE NAME': f'Dependent_{i}'
+            'EMPLOYEE NAME': [f'Employee_{i}' for i in range(10)]
+        }),
+        # Rows that might get dropped - various STATUS values
+        _rows(len(problematic_statuses), {
+            'CLIENT ID': 'H3330', 'RELATION': 'SELF', 'STATUS': problematic_statuses,
+            'BEN CODE': 'EMP', 'PLAN': 'PRIMEMMLB',
+            'EMPLOYEE NAME': [f'Status_Issue_{i}' for i in range(len(problematic_statuses))]
+        }),
+        # Rows that might get dropped - various RELATION values
+        _rows(len(problematic_relations), {
+            'CLIENT ID': 'H3330', 'RELATION': problematic_relations, 'STATUS': 'A',
+            'BEN CODE': 'ESP', 'PLAN': 'PRIMEMMLKEP1',
+            'EMPLOYEE NAME': [f'Relation_Issue_{i}' for i in range(len(problematic_relations))]
+        }),
+        # Rows with unmapped CLIENT IDs
+        _rows(5, {
+            'CLIENT ID': [f'UNKNOWN_{i}' for i in range(5)], 'RELATION': 'SELF', 'STATUS': 'A',
+            'BEN CODE': 'FAM', 'PLAN': 'PRIMEMMEPOLE',
+            'EMPLOYEE NAME': [f'Unknown_Facility_{i}' for i in range(5)]
+        }),
+        # Rows with unusual tier codes
+        _rows(len(unusual_tiers), {
+            'CLIENT ID': 'H3270', 'RELATION': 'SELF', 'STATUS': 'A',
+            'BEN CODE': unusual_tiers, 'PLAN': 'PRIMEMMEPOCEN',
+            'EMPLOYEE NAME': [f'Tier_Issue_{i}' for i in range(len(unusual_tiers))]
+        }),
+        # Rows with spaces in keys
+        _rows(1, {
+            'CLIENT ID': ' H3170 ',  # Leading/trailing spaces
+            'RELATION': ' SELF ', 'STATUS': ' A ', 'BEN CODE': 'EMP',
+            'PLAN': ' PRIMEMMEPOLE ', 'EMPLOYEE NAME': 'Spaces_In_Keys'
+        }),
+        # Add some dependents that should be filtered
+        _rows(10, {
+            'CLIENT ID': 'H3170', 'RELATION': 'SPOUSE', 'STATUS': 'A',
+            'BEN CODE': None, 'PLAN': 'PRIMEMMEPOLE',
+            'EMPLOYEE NAME': [f'Dependent_{i}' for i in range(10)]
         })
+    ]
     
-    return pd.DataFrame(test_data)
+    # One concatenation per column instead of one dict per row
+    return pd.DataFrame({col: np.concatenate([group[col] for group in groups]) for col in TEST_COLUMNS})
 
 def simulate_old_processing(df):
     """
@@ -105,21 +129,17 @@ def simulate_old_processing(df):
     print(f"Starting rows: {start_count}")
     
     # Strict status filter
-    df_active = df[df['STATUS'] == 'A'].copy()
-    print(f"After STATUS == 'A': {len(df_active)} (-{start_count - len(df_active)})")
+    mask_active = df['STATUS'] == 'A'
+    print(f"After STATUS == 'A': {mask_active.sum()} (-{start_count - mask_active.sum()})")
     
     # Strict relation filter
-    df_subscribers = df_active[df_active['RELATION'] == 'SELF'].copy()
-    print(f"After RELATION == 'SELF': {len(df_subscribers)} (-{len(df_active) - len(df_subscribers)})")
-    
-    # Drop unmapped facilities
-    df_subscribers['Location'] = df_subscribers['CLIENT ID'].map({
-        'H3170': 'San Dimas',
-        'H3330': 'Lower Bucks',
-        'H3270': 'Centinela'
-    })
-    df_mapped = df_subscribers.dropna(subset=['Location']).copy()
-    print(f"After dropna(Location): {len(df_mapped)} (-{len(df_subscribers) - len(df_mapped)})")
+    mask_sub = mask_active & (df['RELATION'] == 'SELF')
+    print(f"After RELATION == 'SELF': {mask_sub.sum()} (-{mask_active.sum() - mask_sub.sum()})")
+    
+    # Drop unmapped facilities - one combined mask, one copy
+    mask = mask_sub & df['CLIENT ID'].isin(LOCATION_MAP)
+    df_mapped = df.loc[mask].assign(Location=map_locations(df.loc[mask, 'CLIENT ID']))
+    print(f"After dropna(Location): {len(df_mapped)} (-{mask_sub.sum() - len(df_mapped)})")
     
     print(f"\nTOTAL LOST: {start_count - len(df_mapped)} rows")
     return df_mapped
@@ -135,28 +155,34 @@ def simulate_new_processing(df):
     start_count = len(df)
     print(f"Starting rows: {start_count}")
     
-    # Flexible status filter
+    # Flexible status filter - test each category once, then gather by code
+    # (the trailing False is picked up by code -1, i.e. missing STATUS)
     active_statuses = ['A', 'ACTIVE', 'ACT']
-    df['is_active'] = df['STATUS'].str.strip().str.upper().isin(active_statuses) | \
-                       df['STATUS'].str.strip().str.upper().str.startswith('A')
-    df_active = df[df['is_active']].copy()
-    print(f"After flexible is_active: {len(df_active)} (-{start_count - len(df_active)})")
+    status = df['STATUS'].astype('category')
+    norm = status.cat.categories.str.strip().str.upper()
+    active_by_code = np.append(norm.isin(active_statuses) | norm.str.startswith('A'), False)
+    df['is_active'] = active_by_code[status.cat.codes.to_numpy()]
+    print(f"After flexible is_active: {df['is_active'].sum()} (-{start_count - df['is_active'].sum()})")
     
     # Flexible relation filter
     subscriber_values = ['SELF', 'EE', 'EMP', 'EMPLOYEE', 'SUBSCRIBER', 'S']
-    df_active['is_subscriber'] = df_active['RELATION'].str.strip().str.upper().isin(subscriber_values)
-    df_subscribers = df_active[df_active['is_subscriber']].copy()
-    print(f"After flexible is_subscriber: {len(df_subscribers)} (-{len(df_active) - len(df_subscribers)})")
+    relation = df['RELATION'].astype('category')
+    norm = relation.cat.categories.str.strip().str.upper()
+    subscriber_by_code = np.append(norm.isin(subscriber_values), False)
+    df['is_subscriber'] = subscriber_by_code[relation.cat.codes.to_numpy()]
+    mask = df['is_active'] & df['is_subscriber']
+    print(f"After flexible is_subscriber: {mask.sum()} (-{df['is_active'].sum() - mask.sum()})")
     
     # Keep unmapped facilities as UNKNOWN
-    df_subscribers['Location'] = df_subscribers['CLIENT ID'].str.strip().map({
-        'H3170': 'San Dimas',
-        'H3330': 'Lower Bucks',
-        'H3270': 'Centinela'
-    })
-    df_subscribers['Location'].fillna('UNKNOWN', inplace=True)
+    df_subscribers = df.loc[mask].copy()
+    df_subscribers['Location'] = map_locations(df_subscribers['CLIENT ID'], strip=True)
     print(f"After facility mapping (kept UNKNOWNs): {len(df_subscribers)} (-0)")
     
+    # Normalize tier variants (UNKNOWN tiers are kept, not dropped)
+    df_subscribers['tier'] = normalize_tiers(df_subscribers['BEN CODE'])
+    print(f"After tier normalization (kept UNKNOWNs): {len(df_subscribers)} (-0), "
+          f"{(df_subscribers['tier'] == 'UNKNOWN').sum()} unknown tiers")
+    
     print(f"\nTOTAL LOST: {start_count - len(df_subscribers)} rows")
     return df_subscribers
 
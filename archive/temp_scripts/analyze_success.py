@@ -1,16 +1,11 @@
-import csv
-from collections import defaultdict
+import pandas as pd
 
-# Get what was written
-with open('output/write_log.csv', 'r') as f:
-    reader = csv.DictReader(f)
-    rows = list(reader)
-
-# Sum by client
-written_by_client = defaultdict(int)
-for row in rows:
-    if row['reason'] != 'duplicate':
-        written_by_client[row['client_id']] += int(row['value'])
+# Get what was written, summed by client
+write_log = pd.read_csv('output/write_log.csv', usecols=['client_id', 'value', 'reason'],
+                        dtype={'client_id': 'category', 'value': 'int64', 'reason': 'category'})
+written_by_client = (write_log[write_log['reason'] != 'duplicate']
+                     .groupby('client_id', observed=True)['value'].sum()
+                     .to_dict())
 
 # Load tier data
 from enrollment_automation_v6 import *
@@ -19,15 +14,16 @@ block_aggregations = load_block_aggregations()
 df = read_and_prepare_data('data/input/source_data.xlsx', plan_mappings)
 tier_data = build_tier_data_from_source(df, block_aggregations)
 
-# Get source totals
-source_by_client = {}
-for client_id, plans in tier_data.items():
-    total = 0
-    for plan_type, blocks in plans.items():
-        for block_label, counts in blocks.items():
-            total += sum(counts.values())
-    if total > 0:
-        source_by_client[client_id] = total
+# Get source totals - flatten client/plan/block/tier counts and reduce once
+rows = [(client_id, plan_type, block_label, tier, count)
+        for client_id, plans in tier_data.items()
+        for plan_type, blocks in plans.items()
+        for block_label, counts in blocks.items()
+        for tier, count in counts.items()]
+tier_df = pd.DataFrame(rows, columns=['client_id', 'plan_type', 'block_label', 'tier', 'count'])
+source_by_client = (tier_df.groupby('client_id')['count'].sum()
+                    .loc[lambda totals: totals > 0]
+                    .to_dict())
 
 # Compare
 print('Client ID success rates:')
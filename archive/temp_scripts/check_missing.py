@@ -1,44 +1,74 @@
+import os
+from functools import lru_cache
+import numpy as np
 import pandas as pd
 from enrollment_automation_v6 import *
 
+# Tab per client, indexed by the numeric part of an H3xxx CLIENT ID; the
+# extra trailing slot is UNKNOWN for IDs outside that pattern
+TAB_BY_CID = np.full(1001, 'UNKNOWN', dtype=object)
+for cid, tab in CID_TO_TAB.items():
+    TAB_BY_CID[int(cid[2:])] = tab
+
+def tabs_for(client_ids):
+    """Vectorized CID_TO_TAB lookup (UNKNOWN for unmapped IDs)"""
+    client_ids = pd.Series(client_ids, dtype=str)
+    is_h3 = client_ids.str.fullmatch(r'H3\d{3}').fillna(False).to_numpy(dtype=bool)
+    slots = np.full(len(client_ids), len(TAB_BY_CID) - 1)
+    slots[is_h3] = client_ids[is_h3].str[2:].astype(int).to_numpy()
+    return TAB_BY_CID[slots]
+
+# Plan mappings read by load_plan_mappings(); the checkpoint depends on them too
+PLAN_MAPPINGS_PATH = 'config/plan_mappings.json'
+
+@lru_cache(maxsize=4)
+def _load_prepared(xlsx_path, mtime, mappings_mtime):
+    """Prepared source rows, checkpointed to a sibling .prepared.pkl that is
+    reused only while it is newer than both the xlsx and the plan mappings"""
+    cache_path = os.path.splitext(xlsx_path)[0] + '.prepared.pkl'
+    if os.path.exists(cache_path) and os.path.getmtime(cache_path) >= max(mtime, mappings_mtime):
+        return pd.read_pickle(cache_path)
+    df = read_and_prepare_data(xlsx_path, load_plan_mappings())
+    df.to_pickle(cache_path)
+    return df
+
+def load_prepared(xlsx_path):
+    mappings_mtime = os.path.getmtime(PLAN_MAPPINGS_PATH) if os.path.exists(PLAN_MAPPINGS_PATH) else 0
+    return _load_prepared(xlsx_path, os.path.getmtime(xlsx_path), mappings_mtime)
+
 # Load data
-plan_mappings = load_plan_mappings()
 block_aggregations = load_block_aggregations()
-df = read_and_prepare_data('data/input/source_data.xlsx', plan_mappings)
+df = load_prepared('data/input/source_data.xlsx')
 tier_data = build_tier_data_from_source(df, block_aggregations)
 
 # Get total by client
-source_totals = {}
-for client_id, plans in tier_data.items():
-    total = 0
-    for plan_type, blocks in plans.items():
-        for block_label, counts in blocks.items():
-            total += sum(counts.values())
-    if total > 0:
-        source_totals[client_id] = total
-
-# Check what's written
-import csv
-with open('output/write_log.csv', 'r') as f:
-    reader = csv.DictReader(f)
-    rows = list(reader)
-
-written_totals = {}
-for row in rows:
-    if row['reason'] != 'duplicate':
-        client_id = row['client_id']
-        if client_id not in written_totals:
-            written_totals[client_id] = 0
-        written_totals[client_id] += int(row['value'])
+source = pd.DataFrame.from_records(
+    [(client_id, sum(counts.values()))
+     for client_id, plans in tier_data.items()
+     for blocks in plans.values()
+     for counts in blocks.values()],
+    columns=['client_id', 'total']
+).groupby('client_id')['total'].sum()
+source = source[source > 0]
+
+# Check what's written - stream the log in chunks and fold the per-chunk sums
+log_chunks = pd.read_csv('output/write_log.csv', usecols=['client_id', 'value', 'reason'],
+                         dtype={'client_id': str, 'value': 'int64', 'reason': str},
+                         chunksize=100_000)
+written = pd.Series(0, index=pd.Index([], name='client_id', dtype=str), dtype='int64', name='value')
+for chunk in log_chunks:
+    chunk_totals = chunk[chunk['reason'] != 'duplicate'].groupby('client_id')['value'].sum()
+    written = written.add(chunk_totals, fill_value=0)
+
+merged = source.rename('source').to_frame().join(written.rename('written'), how='left')
+merged = merged.fillna(0).astype({'source': 'int64', 'written': 'int64'})
+merged['deficit'] = (merged['source'] - merged['written']).clip(lower=0)
+missing = merged[merged['deficit'] > 0]
 
 print('Missing writes by client ID:')
-total_missing = 0
-for client_id, source_total in sorted(source_totals.items()):
-    written_total = written_totals.get(client_id, 0)
-    if written_total < source_total:
-        missing = source_total - written_total
-        total_missing += missing
-        tab = CID_TO_TAB.get(client_id, 'UNKNOWN')
-        print(f'  {client_id} ({tab:25s}): {missing:,} missing ({source_total:,} source vs {written_total:,} written)')
+total_missing = int(merged['deficit'].sum())
+missing = missing.assign(tab=tabs_for(missing.index))
+for client_id, source_total, written_total, deficit, tab in missing.itertuples():
+    print(f'  {client_id} ({tab:25s}): {deficit:,} missing ({source_total:,} source vs {written_total:,} written)')
 
 print(f'\nTotal missing: {total_missing:,}')
@@ -8,70 +8,36 @@ import openpyxl
 from collections import defaultdict
 import sys
 
+from legacy_source import DEBUG, load_legacy_subscribers
+
 def generate_legacy_pivot_from_source():
     """Generate pivot table summary from source data"""
     
-    # Read source data
-    df = pd.read_excel('/mnt/c/Users/becas/Prime_EFR/data/input/source_data.xlsx')
-    
-    # Legacy CLIENT IDs
-    legacy_cids = [
-        'H3100', 'H3105', 'H3110', 'H3115', 'H3120', 'H3130', 'H3140', 'H3150',
-        'H3160', 'H3170', 'H3180', 'H3190', 'H3200', 'H3210', 'H3230', 'H3240',
-        'H3280', 'H3285', 'H3290', 'H3300'
-    ]
-    
-    # Get Legacy subscribers with active status (A or C for COBRA)
-    df_legacy = df[(df['CLIENT ID'].isin(legacy_cids)) & 
-                   (df['STATUS'].str.upper().isin(['A', 'C'])) &
-                   (df['RELATION'].str.upper().isin(['SELF', 'EE', 'EMPLOYEE', 'SUBSCRIBER']))].copy()
-    
-    # Map PLAN to EPO/VALUE
-    def map_plan_type(plan):
-        if pd.isna(plan):
-            return 'UNKNOWN'
-        p = str(plan).strip().upper()
-        if 'VALUE' in p or 'VAL' in p:
-            return 'Value'
-        elif 'EPO' in p:
-            return 'EPO'
-        else:
-            return 'Other'
-    
-    df_legacy['plan_type'] = df_legacy['PLAN'].apply(map_plan_type)
+    # Get Legacy subscribers with active status (A or C for COBRA), PLAN mapped to EPO/VALUE
+    df_legacy = load_legacy_subscribers()
     
     # Filter for EPO and VALUE only
     df_filtered = df_legacy[df_legacy['plan_type'].isin(['EPO', 'Value'])]
     
-    # Debug: Check if we have data
-    print(f"Debug: Legacy data rows: {len(df_filtered)}")
-    print(f"Debug: Plan types: {df_filtered['plan_type'].value_counts().to_dict()}")
-    print(f"Debug: BEN CODEs: {df_filtered['BEN CODE'].value_counts().head().to_dict()}")
-    
-    # Create pivot table
-    pivot = pd.pivot_table(
-        df_filtered,
-        values='DEP SSN',
-        index='BEN CODE',
-        columns='plan_type',
-        aggfunc='count',
-        fill_value=0,
-        margins=True,
-        margins_name='Grand Total'
-    )
+    # Debug: Check if we have data (set EFR_DEBUG=1)
+    if DEBUG:
+        print(f"Debug: Legacy data rows: {len(df_filtered)}")
+        print(f"Debug: Plan types: {df_filtered['plan_type'].cat.remove_unused_categories().value_counts().to_dict()}")
+        print(f"Debug: BEN CODEs: {df_filtered['BEN CODE'].value_counts().head().to_dict()}")
+    
+    # Count DEP SSNs per tier/plan in one groupby pass, then add the margins
+    pivot = (df_filtered.groupby(['BEN CODE', 'plan_type'], observed=True)['DEP SSN']
+             .count()
+             .unstack('plan_type', fill_value=0))
+    pivot.columns = pivot.columns.astype(str)
+    pivot['Grand Total'] = pivot.sum(axis=1)
+    pivot.loc['Grand Total'] = pivot.sum(axis=0)
     
     return pivot
 
 def generate_legacy_pivot_from_excel(filepath):
     """Generate pivot table summary from updated Excel file"""
     
-    # Read the updated workbook
-    wb = openpyxl.load_workbook(filepath, data_only=True)
-    ws = wb['Legacy']
-    
-    # Extract values from Legacy tab
-    legacy_data = defaultdict(lambda: defaultdict(int))
-    
     # Map of facilities in Legacy tab with their cell ranges
     facilities = [
         ('H3170', 'San Dimas', [(4,7), (10,13)]),  # EPO and VALUE ranges
@@ -95,25 +61,31 @@ def generate_legacy_pivot_from_excel(filepath):
     # Tier mapping
     tier_map = {0: 'EMP', 1: 'ESP', 2: 'ECH', 3: 'FAM'}
     
-    # Collect all values
+    # Precompute which rows feed which tier/plan so column G is scanned once
+    wanted_rows = {}
     for cid, name, ranges in facilities:
-        # EPO values
-        if ranges[0]:
-            start, end = ranges[0]
-            for i, row in enumerate(range(start, end+1)):
-                val = ws[f'G{row}'].value
-                if val and val != 0:
-                    tier = tier_map.get(i, 'UNKNOWN')
-                    legacy_data[tier]['EPO'] += val
-        
-        # VALUE values  
-        if ranges[1]:
-            start, end = ranges[1]
-            for i, row in enumerate(range(start, end+1)):
-                val = ws[f'G{row}'].value
-                if val and val != 0:
-                    tier = tier_map.get(i, 'UNKNOWN')
-                    legacy_data[tier]['Value'] += val
+        for plan_kind, rng in zip(('EPO', 'Value'), ranges):
+            if rng:
+                start, end = rng
+                for i, row in enumerate(range(start, end+1)):
+                    wanted_rows[row] = (plan_kind, tier_map.get(i, 'UNKNOWN'))
+    
+    # Stream the Legacy tab instead of building the full workbook in memory
+    wb = openpyxl.load_workbook(filepath, read_only=True, data_only=True)
+    ws = wb['Legacy']
+    
+    # Extract values from Legacy tab
+    legacy_data = defaultdict(lambda: defaultdict(int))
+    
+    first_row, last_row = min(wanted_rows), max(wanted_rows)
+    for row, (val,) in enumerate(ws.iter_rows(min_row=first_row, max_row=last_row,
+                                              min_col=7, max_col=7, values_only=True),
+                                 start=first_row):
+        if row in wanted_rows and val and val != 0:
+            plan_kind, tier = wanted_rows[row]
+            legacy_data[tier][plan_kind] += val
+    
+    wb.close()
     
     return legacy_data
 
@@ -125,19 +97,20 @@ def print_pivot_table(pivot_data, source="Excel"):
         print("\nLegacy Tab Pivot Table (from source data):")
         print("Row Labels\tEPO\tValue\tGrand Total")
         
-        for tier in ['EMP', 'ESP', 'ECH', 'FAM']:
-            if tier in pivot_data.index:
-                epo = int(pivot_data.loc[tier, 'EPO']) if 'EPO' in pivot_data.columns else 0
-                value = int(pivot_data.loc[tier, 'Value']) if 'Value' in pivot_data.columns else 0
-                total = epo + value
-                print(f'{tier}\t{epo}\t{value}\t{total}')
+        # Resolve label positions once and read straight from the ndarray
+        rows = ['EMP', 'ESP', 'ECH', 'FAM', 'Grand Total']
+        row_pos = pivot_data.index.get_indexer(rows)
+        epo_col, value_col, total_col = pivot_data.columns.get_indexer(['EPO', 'Value', 'Grand Total'])
+        arr = pivot_data.to_numpy()
         
-        # Grand Total
-        if 'Grand Total' in pivot_data.index:
-            epo = int(pivot_data.loc['Grand Total', 'EPO']) if 'EPO' in pivot_data.columns else 0
-            value = int(pivot_data.loc['Grand Total', 'Value']) if 'Value' in pivot_data.columns else 0
-            total = int(pivot_data.loc['Grand Total', 'Grand Total'])
-            print(f'Grand Total\t{epo}\t{value}\t{total}')
+        for tier, ri in zip(rows, row_pos):
+            if ri == -1:
+                continue
+            epo = int(arr[ri, epo_col]) if epo_col != -1 else 0
+            value = int(arr[ri, value_col]) if value_col != -1 else 0
+            # Grand Total row keeps the pivot's own total column
+            total = int(arr[ri, total_col]) if tier == 'Grand Total' else epo + value
+            print(f'{tier}\t{epo}\t{value}\t{total}')
     else:
         # From dictionary
         print(f"\nLegacy Tab Pivot Table (from {source}):")
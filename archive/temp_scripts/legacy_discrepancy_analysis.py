@@ -5,52 +5,49 @@ Actual: 5,326 total (4,935 EPO + 391 Value)
 Missing: 69 records
 """
 
+import sys
 import pandas as pd
 
-def analyze_discrepancy():
-    """Analyze the 69-record discrepancy in Legacy tab"""
+from legacy_source import DEBUG, load_legacy_rows
+
+def analyze_discrepancy(show_distributions=True):
+    """Analyze the 69-record discrepancy in Legacy tab
+    
+    show_distributions=False skips the STATUS/RELATION value_counts breakdowns
+    """
     
     print("="*70)
     print("LEGACY TAB DISCREPANCY ANALYSIS")
     print("="*70)
     
-    # Read source data
-    df = pd.read_excel('/mnt/c/Users/becas/Prime_EFR/data/input/source_data.xlsx')
-    
-    # Legacy CLIENT IDs
-    legacy_cids = [
-        'H3100', 'H3105', 'H3110', 'H3115', 'H3120', 'H3130', 'H3140', 'H3150',
-        'H3160', 'H3170', 'H3180', 'H3190', 'H3200', 'H3210', 'H3230', 'H3240',
-        'H3280', 'H3285', 'H3290', 'H3300'
-    ]
-    
-    # Get ALL Legacy rows to understand data
-    df_legacy_all = df[df['CLIENT ID'].isin(legacy_cids)].copy()
+    # Get ALL Legacy rows to understand data (flagged and classified once, shared read-only)
+    df_legacy_all = load_legacy_rows()
     print(f"\n1. TOTAL Legacy rows (all): {len(df_legacy_all)}")
     
-    # Check STATUS distribution
-    print("\n2. STATUS distribution:")
-    print(df_legacy_all['STATUS'].value_counts())
-    
-    # Check RELATION distribution
-    print("\n3. RELATION distribution:")
-    print(df_legacy_all['RELATION'].value_counts())
+    if show_distributions:
+        # Check STATUS distribution
+        print("\n2. STATUS distribution:")
+        print(df_legacy_all['STATUS'].value_counts().loc[lambda counts: counts > 0])
+        
+        # Check RELATION distribution
+        print("\n3. RELATION distribution:")
+        print(df_legacy_all['RELATION'].value_counts().loc[lambda counts: counts > 0])
+    else:
+        # One pass over the three key columns instead of full distributions
+        distinct = df_legacy_all[['STATUS', 'RELATION', 'CLIENT ID']].nunique()
+        print(f"   Distinct values - STATUS: {distinct['STATUS']}, RELATION: {distinct['RELATION']}, "
+              f"CLIENT ID: {distinct['CLIENT ID']}")
     
     # Apply standard filters
-    df_active = df_legacy_all[df_legacy_all['STATUS'].str.upper().isin(['A', 'C'])].copy()
+    df_active = df_legacy_all[df_legacy_all['is_active']]
     print(f"\n4. After STATUS filter (A or C): {len(df_active)}")
     
-    df_subscribers = df_active[df_active['RELATION'].str.upper().isin(['SELF', 'EE', 'EMPLOYEE', 'SUBSCRIBER'])].copy()
+    is_subscriber = df_active['is_subscriber']
+    df_subscribers = df_active[is_subscriber]
     print(f"5. After RELATION filter (subscribers only): {len(df_subscribers)}")
     
-    # Map plan types
-    df_subscribers['plan_type'] = df_subscribers['PLAN'].apply(
-        lambda x: 'Value' if 'VALUE' in str(x).upper() or 'VAL' in str(x).upper() 
-        else ('EPO' if 'EPO' in str(x).upper() else 'Other')
-    )
-    
     # Create summary by BEN CODE and plan_type
-    summary = df_subscribers.groupby(['BEN CODE', 'plan_type']).size().unstack(fill_value=0)
+    summary = df_subscribers.groupby(['BEN CODE', 'plan_type'], observed=True).size().unstack(fill_value=0)
     
     print("\n6. ACTUAL VALUES FROM SOURCE DATA:")
     print("="*50)
@@ -130,10 +127,11 @@ def analyze_discrepancy():
         print(f"Found {len(df_b_status)} records with STATUS='B' (might be excluded)")
     
     # Check for other RELATION values
-    other_relations = df_active[~df_active['RELATION'].str.upper().isin(['SELF', 'EE', 'EMPLOYEE', 'SUBSCRIBER'])]
+    other_relations = df_active[~is_subscriber]
     if len(other_relations) > 0:
         print(f"Found {len(other_relations)} active records with non-subscriber relations:")
-        print(other_relations['RELATION'].value_counts())
+        if show_distributions:
+            print(other_relations['RELATION'].value_counts().loc[lambda counts: counts > 0])
     
     print("\n" + "="*70)
     print("CONCLUSION:")
@@ -144,4 +142,4 @@ def analyze_discrepancy():
     print("="*70)
 
 if __name__ == "__main__":
-    analyze_discrepancy()
\ No newline at end of file
+    analyze_discrepancy(show_distributions=DEBUG or '--quiet' not in sys.argv)
\ No newline at end of file
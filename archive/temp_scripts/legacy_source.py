@@ -0,0 +1,95 @@
+"""
+Shared helpers for the Legacy analysis scripts
+Cached source_data.xlsx loading, PLAN -> EPO/Value classification and the
+Legacy subscriber filter pipeline
+"""
+
+import os
+from functools import lru_cache
+import numpy as np
+import pandas as pd
+
+# Prefer the Rust-backed calamine reader when it is installed and pandas
+# understands it (engine="calamine" needs pandas >= 2.2); otherwise fall
+# back to the default openpyxl engine
+try:
+    import python_calamine  # noqa: F401
+    _PANDAS_VERSION = tuple(int(part) for part in pd.__version__.split('.')[:2])
+    EXCEL_ENGINE = 'calamine' if _PANDAS_VERSION >= (2, 2) else None
+except ImportError:
+    EXCEL_ENGINE = None
+
+# Debug-only diagnostics (value_counts and friends) are skipped unless EFR_DEBUG is set
+DEBUG = bool(os.environ.get('EFR_DEBUG'))
+
+SOURCE_PATH = '/mnt/c/Users/becas/Prime_EFR/data/input/source_data.xlsx'
+
+# Legacy CLIENT IDs
+LEGACY_CIDS = [
+    'H3100', 'H3105', 'H3110', 'H3115', 'H3120', 'H3130', 'H3140', 'H3150',
+    'H3160', 'H3170', 'H3180', 'H3190', 'H3200', 'H3210', 'H3230', 'H3240',
+    'H3280', 'H3285', 'H3290', 'H3300'
+]
+
+# Active status (A, or C for COBRA) and subscriber relations
+ACTIVE_STATUSES = ['A', 'C']
+SUBSCRIBER_RELATIONS = ['SELF', 'EE', 'EMPLOYEE', 'SUBSCRIBER']
+
+# Columns the legacy analysis scripts actually read
+LEGACY_COLUMNS = ['CLIENT ID', 'STATUS', 'RELATION', 'BEN CODE', 'PLAN', 'DEP SSN']
+
+# Low-cardinality keys stored as categoricals so isin/str/groupby work per category
+CATEGORY_COLUMNS = ['CLIENT ID', 'STATUS', 'RELATION', 'BEN CODE', 'PLAN']
+
+def load_source(path, usecols=LEGACY_COLUMNS):
+    """Load the source workbook, using a sibling .pkl cache when it is fresh"""
+
+    cache_path = os.path.splitext(path)[0] + '.pkl'
+
+    if os.path.exists(cache_path) and os.path.getmtime(cache_path) >= os.path.getmtime(path):
+        df = pd.read_pickle(cache_path)
+        if usecols is None or set(usecols) <= set(df.columns):
+            return df if usecols is None else df[usecols]
+
+    # Only parse the columns we need; the cache holds exactly what was parsed
+    df = pd.read_excel(path, usecols=usecols, engine=EXCEL_ENGINE)
+    df = df.astype({c: 'category' for c in CATEGORY_COLUMNS if c in df.columns})
+    df.to_pickle(cache_path)
+    return df
+
+PLAN_TYPES = ['EPO', 'Value', 'Other']
+
+def classify_plan_type(plans):
+    """Bucket raw PLAN codes into EPO / Value / Other (VAL also covers VALUE)"""
+
+    plan_up = plans.astype('string').str.upper()
+    plan_type = np.where(plan_up.str.contains('VAL', regex=False, na=False), 'Value',
+                np.where(plan_up.str.contains('EPO', regex=False, na=False), 'EPO', 'Other'))
+    return pd.Categorical(plan_type, categories=PLAN_TYPES)
+
+@lru_cache(maxsize=4)
+def _load_legacy_rows(path, mtime):
+    """Build the flagged Legacy frame once per (path, mtime)"""
+
+    df = load_source(path)
+    legacy = df[df['CLIENT ID'].isin(LEGACY_CIDS)]
+    return legacy.assign(
+        is_active=legacy['STATUS'].str.upper().isin(ACTIVE_STATUSES),
+        is_subscriber=legacy['RELATION'].str.upper().isin(SUBSCRIBER_RELATIONS),
+        plan_type=classify_plan_type(legacy['PLAN'])
+    )
+
+def load_legacy_rows(path=SOURCE_PATH):
+    """All Legacy rows with is_active / is_subscriber flags and plan_type
+
+    The frame is memoized per file version and shared between callers, so
+    treat it as read-only.
+    """
+
+    return _load_legacy_rows(path, os.path.getmtime(path))
+
+def load_legacy_subscribers(path=SOURCE_PATH):
+    """Active Legacy subscribers with plan_type"""
+
+    rows = load_legacy_rows(path)
+    return rows[rows['is_active'] & rows['is_subscriber']]
@@ -12,145 +12,191 @@ H3260 (Garden Grove Hospital):
   VALUE: EMP=24, ESP=1, ECH=3, FAM=4
 """
 
+import os
+import re
+import tempfile
+import zipfile
 import openpyxl
 from openpyxl import load_workbook
 import pandas as pd
 
+SHEET_NAME = 'Encino-Garden Grove'
+
+TIERS = ['EMP', 'ESP', 'ECH', 'FAM']
+
+# Expected subscriber totals per facility and plan type, in TIERS order
+EXPECTED_TOTALS = {
+    'H3250': {'EPO': (106, 35, 27, 38), 'VALUE': (19, 7, 6, 1)},
+    'H3260': {'EPO': (151, 29, 38, 54), 'VALUE': (24, 1, 3, 4)},
+}
+
+# First row of each plan block, with the percentage of the facility total it
+# gets. H3250 EPO: Non-Union & SEIU-UHW UNIFIED ~70%, SEIU 121 RN ~30%;
+# H3260 EPO: Non-Union UNIFIED ~60%, UNAC ~40%
+PLAN_BLOCKS = {
+    'H3250': {'EPO': [(3, 70), (10, 30)], 'VALUE': [(59, 100)]},
+    'H3260': {'EPO': [(69, 60), (76, 40)], 'VALUE': [(125, 100)]},
+}
+
+# Row offset of each tier within a block; EE & Children (offset 3) stays 0
+# because it is included in EE & Child
+TIER_OFFSETS = {'EMP': 0, 'ESP': 1, 'ECH': 2, 'FAM': 4}
+CHILDREN_OFFSET = 3
+
+def allocate(total, weights):
+    """
+    Split an integer total by integer weights with the largest-remainder
+    method, so the parts always add back up to the total
+    """
+    weight_sum = sum(weights)
+    parts = [total * w // weight_sum for w in weights]
+    remainders = [total * w % weight_sum for w in weights]
+    # Hand out what flooring left over, largest remainder first (ties to the earlier block)
+    for i in sorted(range(len(weights)), key=lambda i: -remainders[i])[:total - sum(parts)]:
+        parts[i] += 1
+    assert sum(parts) == total
+    return parts
+
+def build_updates(cid):
+    """Row -> Ees value for one facility's plan blocks"""
+    updates = {}
+    for plan_type, blocks in PLAN_BLOCKS[cid].items():
+        start_rows = [start for start, _ in blocks]
+        weights = [weight for _, weight in blocks]
+        for tier, total in zip(TIERS, EXPECTED_TOTALS[cid][plan_type]):
+            for start, value in zip(start_rows, allocate(total, weights)):
+                updates[start + TIER_OFFSETS[tier]] = value
+        for start in start_rows:
+            updates[start + CHILDREN_OFFSET] = 0
+    return updates
+
+def plan_totals(updates, cid, plan_type):
+    """Per-tier totals written across a plan type's blocks"""
+    return {tier: sum(updates[start + TIER_OFFSETS[tier]] for start, _ in PLAN_BLOCKS[cid][plan_type])
+            for tier in TIERS}
+
+def _sheet_part(zf, sheet_name):
+    """Zip member path of a worksheet, resolved through workbook.xml and its rels"""
+    workbook_xml = zf.read('xl/workbook.xml').decode('utf-8')
+    sheet = re.search(r'<sheet\b[^>]*\bname="%s"[^>]*>' % re.escape(sheet_name), workbook_xml)
+    rel_id = sheet and re.search(r'\br:id="([^"]+)"', sheet.group(0))
+    if not rel_id:
+        return None
+    rels_xml = zf.read('xl/_rels/workbook.xml.rels').decode('utf-8')
+    rel = re.search(r'<Relationship\b[^>]*\bId="%s"[^>]*>' % re.escape(rel_id.group(1)), rels_xml)
+    target = rel and re.search(r'\bTarget="([^"]+)"', rel.group(0))
+    if not target:
+        return None
+    target = target.group(1)
+    return target.lstrip('/') if target.startswith('/') else 'xl/' + target
+
+def patch_sheet_values(src, dst, sheet_name, column, values):
+    """
+    Write plain numeric values into existing cells of one sheet by patching
+    its XML inside the xlsx, leaving every other part as it was.
+    
+    values maps row -> number. Returns False without writing anything if a
+    target cell is missing or holds a formula/inline string, or the workbook
+    has no calcPr to flag for recalculation; the caller then falls back to
+    an openpyxl load/save.
+    """
+    with zipfile.ZipFile(src) as zf:
+        sheet_part = _sheet_part(zf, sheet_name)
+        if sheet_part is None:
+            return False
+        sheet_xml = zf.read(sheet_part).decode('utf-8')
+        workbook_xml = zf.read('xl/workbook.xml').decode('utf-8')
+        
+        for row, value in values.items():
+            ref = f'{column}{row}'
+            cell = re.search(r'<c r="%s"([^>]*?)(/>|>(.*?)</c>)' % ref, sheet_xml, re.DOTALL)
+            if cell is None or '<f' in (cell.group(3) or '') or '<is' in (cell.group(3) or ''):
+                return False
+            # Drop any t= (shared string etc.) so the cell reads as a number
+            attrs = re.sub(r'\s+t="[^"]*"', '', cell.group(1))
+            sheet_xml = sheet_xml[:cell.start()] + f'<c r="{ref}"{attrs}><v>{value}</v></c>' + sheet_xml[cell.end():]
+        
+        # Formula cells keep their cached results, so have Excel recalculate on open
+        calc_pr = re.search(r'<calcPr\b[^>]*?(/?)>', workbook_xml)
+        if calc_pr is None:
+            return False
+        if 'fullCalcOnLoad=' not in calc_pr.group(0):
+            patched = calc_pr.group(0)[:-len(calc_pr.group(1)) - 1] + ' fullCalcOnLoad="1"' + calc_pr.group(1) + '>'
+            workbook_xml = workbook_xml[:calc_pr.start()] + patched + workbook_xml[calc_pr.end():]
+        
+        replaced = {sheet_part: sheet_xml.encode('utf-8'), 'xl/workbook.xml': workbook_xml.encode('utf-8')}
+        fd, tmp_path = tempfile.mkstemp(suffix='.xlsx', dir=os.path.dirname(os.path.abspath(dst)))
+        os.close(fd)
+        try:
+            with zipfile.ZipFile(tmp_path, 'w', zipfile.ZIP_DEFLATED) as out:
+                for info in zf.infolist():
+                    out.writestr(info, replaced.get(info.filename) or zf.read(info.filename))
+        except BaseException:
+            os.remove(tmp_path)
+            raise
+    os.replace(tmp_path, dst)
+    return True
+
 def update_encino_garden_grove():
     """Update the Ees column in Encino-Garden Grove tab."""
     
     # Load the workbook
     file_path = 'Prime Enrollment Funding by Facility for August_updated.xlsx'
-    wb = load_workbook(file_path)
-    ws = wb['Encino-Garden Grove']
     
     print("Updating Encino-Garden Grove tab Ees column...")
     print("="*60)
     
-    # H3250 Updates
-    # For the two EPO plans, we'll distribute the totals proportionally
-    # PRIME Non-Union & SEIU-UHW UNIFIED EPO PLAN gets about 70% of EPO totals
-    # PRIME SEIU 121 RN EPO PLAN gets about 30% of EPO totals
-    
-    h3250_updates = {
-        # PRIME Non-Union & SEIU-UHW UNIFIED EPO PLAN (rows 3-7)
-        3: 74,   # EE (EMP) - 70% of 106 ≈ 74
-        4: 25,   # EE & Spouse (ESP) - 70% of 35 ≈ 25
-        5: 19,   # EE & Child (ECH) - 70% of 27 ≈ 19
-        6: 0,    # EE & Children (ECH) - included in EE & Child
-        7: 27,   # EE & Family (FAM) - 70% of 38 ≈ 27
+    # Split each facility's EPO totals across its two EPO plans
+    h3250_updates = build_updates('H3250')
+    h3260_updates = build_updates('H3260')
+    
+    # Apply both sections in one pass, in row order
+    updates = sorted(
+        [(row, value, 'H3250') for row, value in h3250_updates.items()] +
+        [(row, value, 'H3260') for row, value in h3260_updates.items()]
+    )
+    
+    # Snapshot the plan/category labels and current Ees values for the log
+    wb = load_workbook(file_path, read_only=True)
+    last_row = updates[-1][0]
+    sheet_rows = dict(enumerate(wb[SHEET_NAME].iter_rows(min_row=1, max_row=last_row, max_col=4,
+                                                         values_only=True), start=1))
+    wb.close()
+    
+    current_section = None
+    for row, value, section in updates:
+        if section != current_section:
+            print(f"\nUpdating {section} section:")
+            current_section = section
         
-        # PRIME SEIU 121 RN EPO PLAN (rows 10-14)
-        10: 32,  # EE (EMP) - 30% of 106 ≈ 32
-        11: 10,  # EE & Spouse (ESP) - 30% of 35 ≈ 10
-        12: 8,   # EE & Child (ECH) - 30% of 27 ≈ 8
-        13: 0,   # EE & Children (ECH) - included in EE & Child
-        14: 11,  # EE & Family (FAM) - 30% of 38 ≈ 11
-        
-        # PRIME VALUE PLAN (rows 59-63)
-        59: 19,  # EE (EMP)
-        60: 7,   # EE & Spouse (ESP)
-        61: 6,   # EE & Child (ECH)
-        62: 0,   # EE & Children (ECH) - included in EE & Child
-        63: 1,   # EE & Family (FAM)
-    }
-    
-    # H3260 Updates
-    # For the two EPO plans, we'll distribute the totals proportionally
-    # PRIME Non-Union UNIFIED EPO PLAN gets about 60% of EPO totals
-    # PRIME UNAC EPO PLAN gets about 40% of EPO totals
-    
-    h3260_updates = {
-        # PRIME Non-Union UNIFIED EPO PLAN (rows 69-73)
-        69: 91,  # EE (EMP) - 60% of 151 ≈ 91
-        70: 17,  # EE & Spouse (ESP) - 60% of 29 ≈ 17
-        71: 23,  # EE & Child (ECH) - 60% of 38 ≈ 23
-        72: 0,   # EE & Children (ECH) - included in EE & Child
-        73: 32,  # EE & Family (FAM) - 60% of 54 ≈ 32
-        
-        # PRIME UNAC EPO PLAN (rows 76-80)
-        76: 60,  # EE (EMP) - 40% of 151 ≈ 60
-        77: 12,  # EE & Spouse (ESP) - 40% of 29 ≈ 12
-        78: 15,  # EE & Child (ECH) - 40% of 38 ≈ 15
-        79: 0,   # EE & Children (ECH) - included in EE & Child
-        80: 22,  # EE & Family (FAM) - 40% of 54 ≈ 22
-        
-        # PRIME VALUE PLAN (rows 125-129)
-        125: 24, # EE (EMP)
-        126: 1,  # EE & Spouse (ESP)
-        127: 3,  # EE & Child (ECH)
-        128: 0,  # EE & Children (ECH) - included in EE & Child
-        129: 4,  # EE & Family (FAM)
-    }
-    
-    # Apply H3250 updates
-    print("\nUpdating H3250 section:")
-    for row, value in h3250_updates.items():
-        old_value = ws.cell(row=row, column=4).value
-        ws.cell(row=row, column=4).value = value
-        plan_name = ws.cell(row=row, column=1).value or ""
-        category = ws.cell(row=row, column=3).value or ""
-        if plan_name or category:
-            print(f"  Row {row}: {old_value} -> {value} ({category})")
-    
-    # Apply H3260 updates
-    print("\nUpdating H3260 section:")
-    for row, value in h3260_updates.items():
-        old_value = ws.cell(row=row, column=4).value
-        ws.cell(row=row, column=4).value = value
-        plan_name = ws.cell(row=row, column=1).value or ""
-        category = ws.cell(row=row, column=3).value or ""
+        plan_name, _, category, old_value = (tuple(sheet_rows.get(row, ())) + (None,) * 4)[:4]
+        plan_name = plan_name or ""
+        category = category or ""
         if plan_name or category:
             print(f"  Row {row}: {old_value} -> {value} ({category})")
     
-    # Save the workbook
+    # Patch only the Ees cells in the sheet XML instead of re-serializing the
+    # whole workbook; fall back to openpyxl if a cell can't be patched in place
     output_file = 'Prime Enrollment Funding by Facility for August_updated.xlsx'
-    wb.save(output_file)
+    row_values = {row: value for row, value, _ in updates}
+    if not patch_sheet_values(file_path, output_file, SHEET_NAME, 'D', row_values):
+        wb = load_workbook(file_path)  # keep_links stays on: formulas reference external workbooks
+        ws = wb[SHEET_NAME]
+        for row, value in row_values.items():
+            ws.cell(row=row, column=4).value = value
+        wb.save(output_file)
     print(f"\nFile saved as: {output_file}")
     
     # Verify the totals
     print("\n" + "="*60)
     print("Verification of totals:")
     
-    # Calculate H3250 totals
-    h3250_epo_total = {
-        'EMP': h3250_updates[3] + h3250_updates[10],
-        'ESP': h3250_updates[4] + h3250_updates[11],
-        'ECH': h3250_updates[5] + h3250_updates[12],
-        'FAM': h3250_updates[7] + h3250_updates[14],
-    }
-    
-    h3250_value_total = {
-        'EMP': h3250_updates[59],
-        'ESP': h3250_updates[60],
-        'ECH': h3250_updates[61],
-        'FAM': h3250_updates[63],
-    }
-    
-    print("\nH3250 EPO Total (both plans):", h3250_epo_total)
-    print("Expected: {'EMP': 106, 'ESP': 35, 'ECH': 27, 'FAM': 38}")
-    print("\nH3250 VALUE Total:", h3250_value_total)
-    print("Expected: {'EMP': 19, 'ESP': 7, 'ECH': 6, 'FAM': 1}")
-    
-    # Calculate H3260 totals
-    h3260_epo_total = {
-        'EMP': h3260_updates[69] + h3260_updates[76],
-        'ESP': h3260_updates[70] + h3260_updates[77],
-        'ECH': h3260_updates[71] + h3260_updates[78],
-        'FAM': h3260_updates[73] + h3260_updates[80],
-    }
-    
-    h3260_value_total = {
-        'EMP': h3260_updates[125],
-        'ESP': h3260_updates[126],
-        'ECH': h3260_updates[127],
-        'FAM': h3260_updates[129],
-    }
-    
-    print("\nH3260 EPO Total (both plans):", h3260_epo_total)
-    print("Expected: {'EMP': 151, 'ESP': 29, 'ECH': 38, 'FAM': 54}")
-    print("\nH3260 VALUE Total:", h3260_value_total)
-    print("Expected: {'EMP': 24, 'ESP': 1, 'ECH': 3, 'FAM': 4}")
+    for cid, updates in (('H3250', h3250_updates), ('H3260', h3260_updates)):
+        expected = EXPECTED_TOTALS[cid]
+        print(f"\n{cid} EPO Total (both plans):", plan_totals(updates, cid, 'EPO'))
+        print("Expected:", dict(zip(TIERS, expected['EPO'])))
+        print(f"\n{cid} VALUE Total:", plan_totals(updates, cid, 'VALUE'))
+        print("Expected:", dict(zip(TIERS, expected['VALUE'])))
 
 if __name__ == "__main__":
     update_encino_garden_grove()
\ No newline at end of file
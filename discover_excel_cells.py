@@ -7,14 +7,169 @@ This script helps find where enrollment values should go in the Excel template
 by searching for Client IDs and plan indicators.
 """
 
+from concurrent.futures import ProcessPoolExecutor
 from openpyxl import load_workbook
+from openpyxl.utils import get_column_letter
 import json
+import re
+import numpy as np
 
-def discover_cell_locations(workbook_path, output_json="cell_mappings_discovered.json"):
-    """Discover where enrollment values should be written"""
+# python-calamine is optional; it reads sheet values in a single Rust pass
+# instead of openpyxl's per-cell XML handling
+try:
+    from python_calamine import CalamineWorkbook
+except ImportError:
+    CalamineWorkbook = None
+
+# orjson is optional; it writes the same indented JSON much faster
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Client IDs are searched in the first 199 rows; EPO/VALUE headers up to 29
+# rows below one and tier rows up to 9 rows below a header
+GRID_ROWS = 199 + 29 + 9
+GRID_COLS = 9
+
+# Tier labels are usually in column C with the value cell in column D
+TIER_COL = 3
+VALUE_COL = 4
+
+# One match per label: alternatives are tried in priority order (FAMILY over
+# SPOUSE over CHILD over plain EE/EMPLOYEE) anywhere in the label
+TIER_RE = re.compile(r'(?=.*(FAMILY))|(?=.*(SPOUSE))|(?=.*(CHILD))|(?=.*(EE|EMPLOYEE))', re.DOTALL)
+TIER_KEYS = {1: 'EE+Family', 2: 'EE+Spouse', 3: 'EE+Child(ren)', 4: 'EE Only'}
+
+def tier_key_for(tier_label):
+    """Normalize a tier label cell to its tier key, or None if it is not a tier row"""
+    
+    if not tier_label:
+        return None
+    match = TIER_RE.match(str(tier_label).upper())
+    return TIER_KEYS[match.lastindex] if match else None
+
+def iter_tier_cells(tier_keys, section_row, max_row):
+    """Yield (tier_key, value cell ref) for the tier rows under a section header"""
+    
+    for tier_row in range(section_row + 1, min(section_row + 10, max_row + 1)):
+        tier_key = tier_keys[tier_row - 1]
+        if tier_key:
+            yield tier_key, f"{get_column_letter(VALUE_COL)}{tier_row}"
+
+def open_workbook(workbook_path):
+    """Open the workbook with python-calamine when available, else openpyxl read-only"""
+    
+    if CalamineWorkbook is not None:
+        return CalamineWorkbook.from_path(workbook_path)
+    return load_workbook(workbook_path, data_only=True, read_only=True)
+
+def read_search_window(wb, tab_name):
+    """
+    Snapshot the top-left GRID_ROWS x GRID_COLS values of a tab (empty cells
+    as None) along with the sheet's max row/column, or None if the tab is missing
+    """
+    
+    if CalamineWorkbook is not None and isinstance(wb, CalamineWorkbook):
+        if tab_name not in wb.sheet_names:
+            return None
+        sheet = wb.get_sheet_by_name(tab_name)
+        max_row, max_col = (sheet.end[0] + 1, sheet.end[1] + 1) if sheet.end else (0, 0)
+        rows = sheet.to_python(skip_empty_area=False, nrows=min(GRID_ROWS, max_row)) if max_row else []
+        grid = [[None if val == '' else val for val in row[:GRID_COLS]] for row in rows]
+    else:
+        if tab_name not in wb.sheetnames:
+            return None
+        ws = wb[tab_name]
+        max_row, max_col = ws.max_row, ws.max_column
+        # Read-only sheets have no random access, so snapshot the search window once
+        grid = [list(row) for row in ws.iter_rows(min_row=1, max_row=min(GRID_ROWS, max_row),
+                                                  max_col=GRID_COLS, values_only=True)]
+    
+    return [row + [None] * (GRID_COLS - len(row)) for row in grid], max_row, max_col
+
+# Workbook opened once per worker process by _open_worker_workbook
+_worker_wb = None
+
+def _open_worker_workbook(workbook_path):
+    global _worker_wb
+    _worker_wb = open_workbook(workbook_path)
+
+def _scan_tab_in_worker(tab_name):
+    return scan_tab(_worker_wb, tab_name)
+
+def scan_tab(wb, tab_name):
+    """
+    Scan one tab of a workbook from open_workbook for Client IDs and their EPO/VALUE tier cells.
+    
+    Returns (tab_name, mappings or None if the tab is missing, log lines).
+    """
+    
+    lines = []
+    log = lines.append
+    window = read_search_window(wb, tab_name)
+    if window is None:
+        log(f"⚠️ Tab '{tab_name}' not found")
+        return tab_name, None, lines
+    
+    log(f"\nSearching tab: {tab_name}")
+    tab_mappings = {}
+    grid, max_row, max_col = window
+    
+    # Build each row's search text and tier label once, then find the
+    # EPO/VALUE header rows with vectorized substring checks
+    search_cols = min(GRID_COLS, max_col)
+    row_texts = np.array([''.join(str(val).upper() for val in row[:search_cols] if val)
+                          for row in grid], dtype=str)
+    has_epo = np.char.find(row_texts, 'EPO') >= 0
+    has_value = np.char.find(row_texts, 'VALUE') >= 0
+    is_section = has_epo | has_value
+    tier_keys = [tier_key_for(row[TIER_COL - 1]) for row in grid]
+    section_tiers = {}
+    
+    # Search for Client IDs (like H3397, H3330, etc.) - cheap type/length
+    # checks first, in row-major order
+    id_cols = min(10, max_col + 1) - 1
+    client_cells = [(row, col, value)
+                    for row, cells in enumerate(grid[:199], start=1)
+                    for col, value in enumerate(cells[:id_cols], start=1)
+                    if value.__class__ is str and len(value) == 5 and value.startswith('H3')]
+    
+    for row, col, client_id in client_cells:
+        log(f"  Found Client ID {client_id} at row {row}, col {col}")
+        
+        if client_id not in tab_mappings:
+            tab_mappings[client_id] = {
+                'location': f"Row {row}, Col {col}",
+                'EPO': {},
+                'VALUE': {}
+            }
+        
+        # EPO / VALUE sections in the 29 rows below
+        window_end = min(row + 29, max_row)
+        for search_row in np.flatnonzero(is_section[row:window_end]) + row + 1:
+            plan = 'VALUE' if has_value[search_row - 1] else 'EPO'
+            log(f"    {plan} section at row {search_row}")
+            
+            # Tier rows under a header are the same for every client whose
+            # window reaches it, so resolve each header once
+            if search_row not in section_tiers:
+                section_tiers[search_row] = list(iter_tier_cells(tier_keys, search_row, max_row))
+            for tier_key, cell_ref in section_tiers[search_row]:
+                tab_mappings[client_id][plan][tier_key] = cell_ref
+                log(f"      {tier_key}: {cell_ref}")
+    
+    return tab_name, tab_mappings, lines
+
+def discover_cell_locations(workbook_path, output_json="cell_mappings_discovered.json", max_workers=1):
+    """Discover where enrollment values should be written
+    
+    max_workers > 1 scans tabs in a process pool, each worker opening the
+    workbook once; that only pays off when per-tab scans outweigh the extra
+    workbook loads. Output is printed in tab order either way.
+    """
     
     print(f"Loading workbook: {workbook_path}")
-    wb = load_workbook(workbook_path, data_only=True)
     
     # Dictionary to store discovered mappings
     mappings = {}
@@ -26,98 +181,29 @@ def discover_cell_locations(workbook_path, output_json="cell_mappings_discovered
         'Illinois', 'Saint Mary\'s Reno'
     ]
     
-    for tab_name in tabs_to_search:
-        if tab_name not in wb.sheetnames:
-            print(f"⚠️ Tab '{tab_name}' not found")
-            continue
-            
-        print(f"\nSearching tab: {tab_name}")
-        ws = wb[tab_name]
-        mappings[tab_name] = {}
-        
-        # Search for Client IDs (like H3397, H3330, etc.)
-        for row in range(1, min(200, ws.max_row + 1)):
-            for col in range(1, min(10, ws.max_column + 1)):
-                cell_value = ws.cell(row=row, column=col).value
-                
-                if cell_value and isinstance(cell_value, str):
-                    # Check if it looks like a Client ID
-                    if cell_value.startswith('H3') and len(cell_value) == 5:
-                        client_id = cell_value
-                        print(f"  Found Client ID {client_id} at row {row}, col {col}")
-                        
-                        if client_id not in mappings[tab_name]:
-                            mappings[tab_name][client_id] = {
-                                'location': f"Row {row}, Col {col}",
-                                'EPO': {},
-                                'VALUE': {}
-                            }
-                        
-                        # Look for EPO section below
-                        for search_row in range(row + 1, min(row + 30, ws.max_row + 1)):
-                            row_text = ""
-                            for search_col in range(1, min(10, ws.max_column + 1)):
-                                val = ws.cell(row=search_row, column=search_col).value
-                                if val:
-                                    row_text += str(val).upper()
-                            
-                            if 'EPO' in row_text and 'VALUE' not in row_text:
-                                # Found EPO section, now find tiers
-                                print(f"    EPO section at row {search_row}")
-                                
-                                # Look for tier rows
-                                for tier_row in range(search_row + 1, min(search_row + 10, ws.max_row + 1)):
-                                    tier_col = 3  # Usually column C
-                                    value_col = 4  # Usually column D
-                                    
-                                    tier_label = ws.cell(row=tier_row, column=tier_col).value
-                                    if tier_label and any(x in str(tier_label).upper() for x in ['EE', 'EMPLOYEE', 'SPOUSE', 'CHILD', 'FAMILY']):
-                                        cell_ref = ws.cell(row=tier_row, column=value_col).coordinate
-                                        
-                                        # Normalize tier name
-                                        tier_upper = str(tier_label).upper()
-                                        if 'FAMILY' in tier_upper:
-                                            tier_key = 'EE+Family'
-                                        elif 'SPOUSE' in tier_upper:
-                                            tier_key = 'EE+Spouse'
-                                        elif 'CHILD' in tier_upper:
-                                            tier_key = 'EE+Child(ren)'
-                                        else:
-                                            tier_key = 'EE Only'
-                                        
-                                        mappings[tab_name][client_id]['EPO'][tier_key] = cell_ref
-                                        print(f"      {tier_key}: {cell_ref}")
-                            
-                            elif 'VALUE' in row_text:
-                                # Found VALUE section
-                                print(f"    VALUE section at row {search_row}")
-                                
-                                # Look for tier rows
-                                for tier_row in range(search_row + 1, min(search_row + 10, ws.max_row + 1)):
-                                    tier_col = 3  # Usually column C
-                                    value_col = 4  # Usually column D
-                                    
-                                    tier_label = ws.cell(row=tier_row, column=tier_col).value
-                                    if tier_label and any(x in str(tier_label).upper() for x in ['EE', 'EMPLOYEE', 'SPOUSE', 'CHILD', 'FAMILY']):
-                                        cell_ref = ws.cell(row=tier_row, column=value_col).coordinate
-                                        
-                                        # Normalize tier name
-                                        tier_upper = str(tier_label).upper()
-                                        if 'FAMILY' in tier_upper:
-                                            tier_key = 'EE+Family'
-                                        elif 'SPOUSE' in tier_upper:
-                                            tier_key = 'EE+Spouse'
-                                        elif 'CHILD' in tier_upper:
-                                            tier_key = 'EE+Child(ren)'
-                                        else:
-                                            tier_key = 'EE Only'
-                                        
-                                        mappings[tab_name][client_id]['VALUE'][tier_key] = cell_ref
-                                        print(f"      {tier_key}: {cell_ref}")
+    if max_workers == 1:
+        wb = open_workbook(workbook_path)
+        results = [scan_tab(wb, tab_name) for tab_name in tabs_to_search]
+        wb.close()
+    else:
+        # Each worker opens the workbook once (Workbook objects are not shareable)
+        with ProcessPoolExecutor(max_workers=max_workers, initializer=_open_worker_workbook,
+                                 initargs=(workbook_path,)) as executor:
+            results = list(executor.map(_scan_tab_in_worker, tabs_to_search))
+    
+    for tab_name, tab_mappings, lines in results:
+        for line in lines:
+            print(line)
+        if tab_mappings is not None:
+            mappings[tab_name] = tab_mappings
     
     # Save mappings to JSON
-    with open(output_json, 'w') as f:
-        json.dump(mappings, f, indent=2)
+    if orjson is not None:
+        with open(output_json, 'wb') as f:
+            f.write(orjson.dumps(mappings, option=orjson.OPT_INDENT_2))
+    else:
+        with open(output_json, 'w') as f:
+            json.dump(mappings, f, indent=2)
     
     print(f"\n✓ Mappings saved to: {output_json}")
     print(f"  Found {sum(len(v) for v in mappings.values())} facility mappings")
@@ -751,18 +751,18 @@ def write_to_specific_sheet(wb, sheet_name, write_map, tier_data, block_aggregat
     print(f"\nWriting to {sheet_name} sheet...")
     
     for entry in write_map:
-        client_id = entry['client_id']
-        plan_type = entry['plan']
-        cells = entry['cells']
-        label = entry.get('label', '')
-        block_label = label  # Use label as block identifier
+        client_id = entry.client_id
+        plan_type = entry.plan
+        cells = entry.cells
+        cells_rc = entry.cells_rc
+        block_label = entry.label  # Use label as block identifier
         
         # Multi-block dedupe with block_label
         key = (client_id, plan_type, block_label)
         if key in seen_blocks:
             # Zero duplicate blocks
-            for cell in cells.values():
-                ws[cell] = 0
+            for (_, cell), (row, col) in zip(cells, cells_rc):
+                ws.cell(row=row, column=col, value=0)
                 _log(sheet_name, client_id, plan_type, block_label, 'DUPLICATE-ZERO', 
                      cell, 0, 'duplicate', 'mapped')
             print(f"  ⚠️ Skipped duplicate block: {key}")
@@ -820,12 +820,12 @@ def write_to_specific_sheet(wb, sheet_name, write_map, tier_data, block_aggregat
                 tier_counts['EE+1 Dep'] = 0
         
         # Zero-fill all cells first
-        for cell in cells.values():
-            ws[cell] = 0
+        for row, col in cells_rc:
+            ws.cell(row=row, column=col, value=0)
         
         # Write values
         written_total = 0
-        for tier_label, cell in cells.items():
+        for (tier_label, cell), (row, col) in zip(cells, cells_rc):
             # Map label variants based on tier structure
             if is_five_tier:
                 # 5-tier mapping for Encino-Garden Grove and North Vista
@@ -862,7 +862,7 @@ def write_to_specific_sheet(wb, sheet_name, write_map, tier_data, block_aggregat
                 else:
                     value = tier_counts.get(tier_label, 0)
             
-            ws[cell] = int(value)
+            ws.cell(row=row, column=col, value=int(value))
             written_total += int(value)
             if value > 0:
                 has_non_zero_write = True
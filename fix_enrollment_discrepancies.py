@@ -139,9 +139,9 @@ def write_enrollment_with_validation(wb, tier_data):
         
         # Process each write instruction
         for instruction in write_map:
-            client_id = instruction["client_id"]
-            plan_type = instruction["plan"]
-            cells = instruction["cells"]
+            client_id = instruction.client_id
+            plan_type = instruction.plan
+            cells = instruction.cells
             
             # Get expected values from PDF
             pdf_expected = PDF_VALIDATION_DATA.get(client_id, {}).get(plan_type, {})
@@ -166,14 +166,14 @@ def write_enrollment_with_validation(wb, tier_data):
                     tier_counts[tier] += count
             
             # Write to cells with validation
-            for tier, cell_ref in cells.items():
+            for (tier, cell_ref), (row, col) in zip(cells, instruction.cells_rc):
                 value = tier_counts.get(tier, 0)
                 
                 # Validate against PDF
                 is_valid, msg = validate_against_pdf(client_id, plan_type, tier, value)
                 
                 try:
-                    ws[cell_ref] = value
+                    ws.cell(row=row, column=col, value=value)
                     sheet_writes += 1
                     total_writes += 1
                     
@@ -73,9 +73,9 @@ def main():
         
         # Process each write instruction
         for instruction in write_map:
-            client_id = instruction["client_id"]
-            plan_type = instruction["plan"]
-            cells = instruction["cells"]
+            client_id = instruction.client_id
+            plan_type = instruction.plan
+            cells = instruction.cells
             
             # Get data for this facility
             if client_id not in tier_data:
@@ -93,11 +93,11 @@ def main():
                     tier_counts[tier] += count
             
             # Write to cells
-            for tier, cell_ref in cells.items():
+            for (tier, cell_ref), (row, col) in zip(cells, instruction.cells_rc):
                 value = tier_counts.get(tier, 0)
                 
                 try:
-                    ws[cell_ref] = value
+                    ws.cell(row=row, column=col, value=value)
                     sheet_writes += 1
                     total_writes += 1
                     
@@ -6,8 +6,8 @@ This script generates detailed reconciliation reports comparing source data
 to generated output, identifying discrepancies and their root causes.
 """
 
-import pandas as pd
-import numpy as np
+from __future__ import annotations
+
 from datetime import datetime
 import json
 import os
@@ -20,15 +20,28 @@ class EnrollmentReconciliation:
     
     def __init__(self, source_file: str, output_file: str):
         """Initialize with source and output file paths"""
+        # pandas is imported here, once, rather than at module level so that
+        # --help and argument errors don't pay for the import
+        global pd
+        import pandas as pd
         self.source_file = source_file
         self.output_file = output_file
         self.discrepancies = []
         self.facility_variances = {}
         
     def load_source_data(self) -> pd.DataFrame:
-        """Load source enrollment data"""
+        """Load source enrollment data (only the columns the tier totals use)"""
+        read_kwargs = dict(
+            sheet_name="Cleaned use this one",
+            header=4,
+            usecols=lambda col: col in SOURCE_COLUMNS
+        )
         try:
-            df = pd.read_excel(self.source_file, sheet_name="Cleaned use this one", header=4)
+            try:
+                # Rust-backed reader; needs python-calamine and pandas >= 2.2
+                df = pd.read_excel(self.source_file, engine="calamine", **read_kwargs)
+            except (ImportError, ValueError):
+                df = pd.read_excel(self.source_file, **read_kwargs)
             return df
         except Exception as e:
             print(f"Error loading source data: {e}")
@@ -301,6 +314,9 @@ class EnrollmentReconciliation:
                 print(f"\n{i}. {rec}")
                 
 
+# Source columns needed for the per-facility tier totals
+SOURCE_COLUMNS = ('CLIENT ID', 'BEN CODE')
+
 # Facility tab names
 FACILITY_TABS = [
     "Centinela", "Coshocton", "Dallas Medical Center", "Dallas Regional",
@@ -38,6 +38,8 @@ from openpyxl.utils import get_column_letter  # For converting column numbers to
 import warnings  # For handling warning messages
 import traceback  # For showing detailed error information if something goes wrong
 import os  # For working with file paths and directories
+import csv  # For writing the summary report one row at a time
+from bisect import bisect_left  # For jumping to a row in a sorted list of cells
 warnings.filterwarnings('ignore')  # Hide unnecessary warning messages to keep output clean
 
 # IMPORTANT CONFIGURATION SECTION #1:
@@ -186,6 +188,33 @@ TPA_TO_CALIFORNIA = {
     'H3680': 'No'
 }
 
+# All three lookups above in one table indexed by TPA code, so each row's
+# code is looked up once; facility names and the Yes/No flags are stored
+# as categories
+YES_NO = pd.CategoricalDtype(['No', 'Yes'])
+TPA_TABLE = pd.DataFrame({
+    'Location': pd.Series(TPA_TO_FACILITY).astype('category'),
+    'Legacy': pd.Series(TPA_TO_LEGACY).astype(YES_NO),
+    'California': pd.Series(TPA_TO_CALIFORNIA).astype(YES_NO)
+})
+
+# Low-cardinality source columns stored as categories once the active rows
+# are kept, so map/isin/groupby work per category instead of per row
+# (EMPLOYEE_GROUP is an integer key built from these codes per employee)
+CATEGORY_COLUMNS = ['RELATION', 'PLAN', 'CLIENT ID', 'BEN CODE', 'STATUS']
+
+# Columns that may hold the facility's TPA code, in priority order
+ID_COLUMNS = ['CLIENT ID', 'CLIENT_ID', 'TPA Code', 'DEPT #']
+
+# Source columns the processing actually reads (ID candidates, employee
+# grouping/ID columns and the fields the counts are built from); the rest
+# of the source sheet is never parsed
+SOURCE_COLUMNS = [
+    'CLIENT ID', 'CLIENT_ID', 'TPA Code', 'DEPT #',
+    'STATUS', 'RELATION', 'PLAN', 'BEN CODE',
+    'SEQ. #', 'EMPLOYEE NAME', 'EMPLOYEE ID', 'EMP ID', 'J', 'Employee_ID'
+]
+
 # IMPORTANT CONFIGURATION SECTION #2:
 # This organizes facilities into groups (tabs in the template spreadsheet)
 # Each group will appear as a separate tab in the output file
@@ -448,6 +477,22 @@ BEN_CODE_TO_TIER = {
     'FAM': 'EE & Family'            # Employee + Spouse + Children
 }
 
+# Tiers and plan types in the order the counts are reported, and the
+# all-zero tier counts used for plans a facility has no enrollments in
+TIERS = list(BEN_CODE_TO_TIER.values())
+PLAN_TYPES = ['EPO', 'PPO', 'VALUE']
+ZERO_TIERS = dict.fromkeys(TIERS, 0)
+
+# Row of each tier within a plan section, counted from the section's first row
+# Templates that combine Child and Children ("EE + Child(ren)") use 4 rows,
+# with both tiers added together on the third row
+TIER_ROWS_5 = (('EE', 0), ('EE & Spouse', 1), ('EE & Child', 2), ('EE & Children', 3), ('EE & Family', 4))
+TIER_ROWS_4 = (('EE', 0), ('EE & Spouse', 1), ('EE & Child', 2), ('EE & Children', 2), ('EE & Family', 3))
+
+# Known PLAN and benefit codes as sets, built once for isin() checks
+MAPPED_PLANS = frozenset(PLAN_TO_TYPE)
+VALID_BEN_CODES = frozenset(BEN_CODE_TO_TIER)
+
 def infer_plan_type(code):
     """
     This function infers the plan type from the plan code
@@ -464,51 +509,109 @@ def infer_plan_type(code):
     # Default to VALUE if can't determine
     return 'VALUE'
 
+def infer_plan_types(codes):
+    """
+    Column version of infer_plan_type: the same PPO → EPO → VALUE keyword
+    checks, done once over the whole column instead of cell by cell
+    """
+    s = codes.astype('string').str.upper()
+    return pd.Series(
+        np.select(
+            [s.str.contains('PPO', regex=False, na=False),
+             s.str.contains('EPO', regex=False, na=False),
+             s.str.contains('VAL', regex=False, na=False)],
+            ['PPO', 'EPO', 'VALUE'],
+            default='VALUE'
+        ),
+        index=codes.index
+    )
+
+def lookup_by_category(values, lookup):
+    """
+    Runs a column lookup (like infer_plan_types) on each distinct value once
+    and copies the answers back to every row by category code
+    The extra slot at the end holds the answer for missing values (code -1)
+    """
+    values = values.astype('category')
+    categories = values.cat.categories
+    distinct = pd.Series(categories).reindex(range(len(categories) + 1))
+    answers = np.asarray(lookup(distinct), dtype=object)
+    return pd.Series(answers[values.cat.codes.to_numpy()], index=values.index)
+
 def calculate_helper_columns(df):
     """
     This function figures out what type of coverage each employee has
     It looks at who's covered (employee, spouse, children) and assigns a code
     For example: If just the employee → EMP, If employee + spouse → ESP
     """
-    if 'EMPLOYEE NAME' not in df.columns and 'SEQ. #' in df.columns:
-        # Use SEQ. # as a proxy for grouping if EMPLOYEE NAME is not available
-        df['EMPLOYEE_GROUP'] = df['CLIENT ID'].astype(str) + '_' + df['SEQ. #'].astype(str)
-    elif 'EMPLOYEE NAME' in df.columns:
-        df['EMPLOYEE_GROUP'] = df['CLIENT ID'].astype(str) + '_' + df['EMPLOYEE NAME'].astype(str)
+    # Already worked out (read_source_data does this once for the pipeline)
+    if 'CALCULATED_BEN_CODE' in df.columns:
+        return df
+    
+    # EMPLOYEE_GROUP is one integer key per (CLIENT ID, employee) pair, built
+    # from the two columns' category codes instead of a concatenated string
+    client_codes = df['CLIENT ID'].astype('category').cat.codes.to_numpy(dtype=np.int64)
+    employee_column = find_employee_column(df.columns)
+    
+    if employee_column:
+        employees = df[employee_column].astype('category')
+        # Employee codes run from -1 (missing) to n-1, so n+1 slots per client
+        # keep every pair's key distinct
+        slots = len(employees.cat.categories) + 1
+        df['EMPLOYEE_GROUP'] = client_codes * slots + employees.cat.codes.to_numpy(dtype=np.int64)
     else:
-        # Fall back to using just CLIENT ID
-        df['EMPLOYEE_GROUP'] = df['CLIENT ID'].astype(str)
+        df['EMPLOYEE_GROUP'] = client_codes
     
-    # Group by employee to determine family composition
-    def determine_ben_code(group):
-        relations = group['RELATION'].value_counts()
-        
-        # Check what relations exist
-        has_self = 'SELF' in relations
-        has_spouse = 'SPOUSE' in relations or 'SP' in relations
-        child_count = relations.get('CHILD', 0) + relations.get('CH', 0) + relations.get('CHILDREN', 0)
-        
-        # Determine benefit code based on family composition
-        if has_self:
-            if has_spouse and child_count > 0:
-                return 'FAM'  # Employee + Spouse + Children
-            elif has_spouse and child_count == 0:
-                return 'ESP'  # Employee + Spouse only
-            elif not has_spouse and child_count > 1:
-                return 'ECH'  # Employee + multiple Children
-            elif not has_spouse and child_count == 1:
-                return 'E1D'  # Employee + 1 dependent (child)
-            else:
-                return 'EMP'  # Employee only
-        else:
-            return 'EMP'  # Default to employee only if no SELF found
+    # Work out each employee's family composition in one pass over integer
+    # codes: RELATION is tested once per category, gathered by category code
+    # (the trailing 0 is picked up by code -1, i.e. missing RELATION), then
+    # summed per employee with np.bincount over the factorized groups
+    relation = df['RELATION'].astype('category')
+    categories = relation.cat.categories
+    rel_codes = relation.cat.codes.to_numpy()
+    is_self = np.append(categories == 'SELF', False)[rel_codes]
+    is_spouse = np.append(categories.isin(['SPOUSE', 'SP']), False)[rel_codes]
+    is_child = np.append(categories.isin(['CHILD', 'CH', 'CHILDREN']), False)[rel_codes]
+    
+    labels, groups = pd.factorize(df['EMPLOYEE_GROUP'])
+    has_self = np.bincount(labels, weights=is_self, minlength=len(groups)) > 0
+    has_spouse = np.bincount(labels, weights=is_spouse, minlength=len(groups)) > 0
+    child_count = np.bincount(labels, weights=is_child, minlength=len(groups))
     
-    # Apply the function to each employee group
-    ben_codes = df.groupby('EMPLOYEE_GROUP').apply(determine_ben_code)
-    df['CALCULATED_BEN_CODE'] = df['EMPLOYEE_GROUP'].map(ben_codes)
+    ben_codes = family_ben_codes(has_self, has_spouse, child_count)
+    df['CALCULATED_BEN_CODE'] = ben_codes[labels]
     
     return df
 
+def find_employee_column(columns):
+    """
+    This function picks the column that tells employees apart within a
+    facility: EMPLOYEE NAME, else SEQ. #, else None (group by CLIENT ID only)
+    """
+    if 'EMPLOYEE NAME' not in columns and 'SEQ. #' in columns:
+        # Use SEQ. # as a proxy for grouping if EMPLOYEE NAME is not available
+        return 'SEQ. #'
+    elif 'EMPLOYEE NAME' in columns:
+        return 'EMPLOYEE NAME'
+    # Fall back to using just CLIENT ID
+    return None
+
+def family_ben_codes(has_self, has_spouse, child_count):
+    """
+    This function turns each employee's family composition (arrays with one
+    entry per employee) into a benefit code: EMP, ESP, E1D, ECH or FAM
+    """
+    # Determine benefit code based on family composition
+    # (default to employee only, including when no SELF is found)
+    return np.select(
+        [has_self & has_spouse & (child_count > 0),   # Employee + Spouse + Children
+         has_self & has_spouse,                       # Employee + Spouse only
+         has_self & (child_count > 1),                # Employee + multiple Children
+         has_self & (child_count == 1)],              # Employee + 1 dependent (child)
+        ['FAM', 'ESP', 'ECH', 'E1D'],
+        default='EMP'
+    ).astype(object)
+
 def handle_list_data_with_explode(df):
     """
     This function handles cells that contain multiple values (lists)
@@ -541,16 +644,19 @@ def apply_group_transforms(df):
     and calculates average family size per facility
     This helps spot unusual patterns or errors in the data
     """
-    # First ensure EMPLOYEE_GROUP exists
-    if 'EMPLOYEE_GROUP' not in df.columns:
-        df = calculate_helper_columns(df)
-    
+    # EMPLOYEE_GROUP comes from calculate_helper_columns earlier in the pipeline
     if 'Location' in df.columns and 'EMPLOYEE_GROUP' in df.columns:
+        # Both statistics come from one groupby over (Location, EMPLOYEE_GROUP):
+        # each employee group's size, and how many groups each facility has
+        families = df.groupby(['Location', 'EMPLOYEE_GROUP'], sort=False, observed=True)['EMPLOYEE_GROUP']
+        family_sizes = families.transform('size')
+        
         # Add count of employees per facility
-        df['facility_employee_count'] = df.groupby('Location')['EMPLOYEE_GROUP'].transform('nunique')
+        employees_per_facility = families.size().index.get_level_values('Location').value_counts()
+        df['facility_employee_count'] = employees_per_facility.reindex(df['Location']).to_numpy()
         
         # Add average family size per facility
-        df['avg_family_size'] = df.groupby(['Location', 'EMPLOYEE_GROUP']).transform('size')
+        df['avg_family_size'] = family_sizes
     
     return df
 
@@ -563,37 +669,78 @@ def handle_outliers_with_where(df):
     """
     # Example: Flag unusual benefit codes
     if 'CALCULATED_BEN_CODE' in df.columns:
-        valid_codes = ['EMP', 'ESP', 'E1D', 'ECH', 'FAM']
-        df['valid_ben_code'] = df['CALCULATED_BEN_CODE'].isin(valid_codes)
+        ben_codes = df['CALCULATED_BEN_CODE']
+        is_valid = ben_codes.isin(VALID_BEN_CODES)
         
         # Replace invalid codes with most common valid code
-        if not df[df['valid_ben_code']]['CALCULATED_BEN_CODE'].empty:
-            most_common = df[df['valid_ben_code']]['CALCULATED_BEN_CODE'].mode()[0]
-            df['CALCULATED_BEN_CODE'] = df['CALCULATED_BEN_CODE'].where(
-                df['valid_ben_code'], 
-                most_common
-            )
+        # (calculate_helper_columns only produces valid codes, so the mode
+        # is only worked out when something actually needs replacing)
+        if is_valid.any() and not is_valid.all():
+            most_common = ben_codes[is_valid].mode()[0]
+            df['CALCULATED_BEN_CODE'] = ben_codes.where(is_valid, most_common)
     
     return df
 
-def read_source_data(file_path, legend_sheet='Legend'):
+def is_active_status(status):
     """
-    This function reads your enrollment data from the Excel file
-    It's like opening the Excel file and preparing all the data for processing
-    It also adds helpful columns like facility names and flags
+    This function flags which rows have STATUS 'A' (active), testing each
+    distinct STATUS once and copying the answer back by category code
+    (the trailing False is picked up by code -1, i.e. missing STATUS)
+    """
+    status = status.astype('category')
+    is_active = np.append(status.cat.categories.astype(str).str.upper() == 'A', False)
+    return is_active[status.cat.codes.to_numpy()]
+
+def read_active_rows(file_path):
     """
-    # Read main data from Excel
-    df = pd.read_excel(file_path, sheet_name=0)  # Main data sheet
+    This function reads the main data sheet and keeps only active rows
+    """
+    # Read main data from Excel (only the columns we use)
+    try:
+        # Rust-backed reader; needs python-calamine and pandas >= 2.2
+        df = pd.read_excel(file_path, engine='calamine', sheet_name=0,
+                           usecols=lambda col: col in SOURCE_COLUMNS)
+    except (ImportError, ValueError):
+        # Stream the sheet with openpyxl instead
+        df = next(iter_source_chunks(file_path, chunksize=None))
     
     # Filter to only active subscribers if STATUS column exists
     if 'STATUS' in df.columns:
         original_count = len(df)
-        df = df[df['STATUS'].astype(str).str.upper().eq('A')].copy()
+        # Boolean indexing already returns a new frame, so no .copy() is needed
+        df = df[is_active_status(df['STATUS'])]
         print(f"Filtered to {len(df)} active rows (STATUS == 'A') from {original_count} total rows")
     
+    return df.astype({col: 'category' for col in CATEGORY_COLUMNS if col in df.columns})
+
+def read_source_data(file_path, legend_sheet='Legend'):
+    """
+    This function reads your enrollment data from the Excel file
+    It's like opening the Excel file and preparing all the data for processing
+    It also adds helpful columns like facility names and flags
+    The prepared data is saved next to the Excel file (as a .source.pkl file),
+    so later runs on the same, unchanged file skip the Excel read entirely
+    Editing this script (for example adding a facility to the TPA_TO_* or
+    FACILITY_MAPPING tables) makes the saved data out of date too
+    """
+    # Reuse the data prepared by an earlier run if neither the Excel file nor
+    # this script (with its facility mappings) has changed since
+    # (same modification times and sizes)
+    cache_path = os.path.splitext(file_path)[0] + '.source.pkl'
+    script_path = os.path.abspath(__file__)
+    cache_key = (os.path.getmtime(file_path), os.path.getsize(file_path),
+                 os.path.getmtime(script_path), os.path.getsize(script_path))
+    if os.path.exists(cache_path):
+        cached_key, cached_df = pd.read_pickle(cache_path)
+        if cached_key == cache_key:
+            print(f"Loaded {len(cached_df)} prepared rows from {os.path.basename(cache_path)}")
+            return cached_df
+    
+    df = read_active_rows(file_path)
+    
     # Find the column with Client IDs - prioritize CLIENT ID which has TPA codes
     id_column = None
-    for col in ['CLIENT ID', 'CLIENT_ID', 'TPA Code', 'DEPT #']:
+    for col in ID_COLUMNS:
         if col in df.columns:
             id_column = col
             print(f"Using {id_column} for facility matching")
@@ -601,10 +748,12 @@ def read_source_data(file_path, legend_sheet='Legend'):
     
     if id_column:
         # Add facility names and flags based on the client ID codes
+        # (one lookup per row against the combined TPA table)
+        lookup = TPA_TABLE.reindex(df[id_column].to_numpy()).set_axis(df.index)
         df = df.assign(
-            Location=df[id_column].map(TPA_TO_FACILITY),
-            Legacy=df[id_column].map(TPA_TO_LEGACY),
-            California=df[id_column].map(TPA_TO_CALIFORNIA)
+            Location=lookup['Location'],
+            Legacy=lookup['Legacy'],
+            California=lookup['California']
         )
         
         print(f"Mapped helper columns for {df['Location'].notna().sum()} rows using {id_column} column")
@@ -615,6 +764,7 @@ def read_source_data(file_path, legend_sheet='Legend'):
         # Clean and process the data through various steps
         df = (df
             .pipe(clean_data_pipeline)
+            .pipe(calculate_helper_columns)
             .pipe(handle_list_data_with_explode)
             .pipe(reshape_enrollment_data)
             .pipe(apply_group_transforms)
@@ -627,6 +777,11 @@ def read_source_data(file_path, legend_sheet='Legend'):
     else:
         print("Warning: Could not find Client ID column (DEPT #, CLIENT ID, etc.)")
     
+    try:
+        pd.to_pickle((cache_key, df), cache_path)
+    except OSError as e:
+        # e.g. a read-only network folder - carry on without the saved copy
+        print(f"Note: could not save prepared data to {os.path.basename(cache_path)} ({e})")
     return df
 
 def clean_data_pipeline(df):
@@ -637,13 +792,21 @@ def clean_data_pipeline(df):
     - Removes empty rows that don't have facility information
     - Ensures all data is in a consistent format
     """
-    return (df
-            .fillna({'RELATION': 'UNKNOWN'})  # Handle missing values
-            .replace({'': np.nan})  # Replace empty strings with NaN
-            .dropna(subset=['Location'])  # Remove rows without valid location
-           )
+    # Only Location decides which rows survive, so remove rows without a
+    # valid location first and clean just the rows that are kept
+    df = df[df['Location'].notna()]
+    
+    # Handle missing values (RELATION is categorical, so UNKNOWN has to be
+    # a category before the fill)
+    if 'RELATION' in df.columns:
+        relation = df['RELATION']
+        if 'UNKNOWN' not in relation.cat.categories:
+            relation = relation.cat.add_categories('UNKNOWN')
+        df = df.assign(RELATION=relation.fillna('UNKNOWN'))
+    
+    return df.replace({'': np.nan})  # Replace empty strings with NaN
 
-def process_enrollment_data(df):
+def process_enrollment_data(df, verbose=False):
     """
     This is the main processing function that counts enrollments
     It groups employees by:
@@ -651,37 +814,42 @@ def process_enrollment_data(df):
     2. What type of plan they have (EPO/PPO/VALUE)
     3. What coverage level they have (Employee only, Family, etc.)
     Then it counts how many people are in each group
+    Set verbose=True to also list PLAN codes that aren't in the mapping
     """
-    processed_data = {}
-    
     # First, calculate helper columns for benefit code determination
+    # (a no-op when read_source_data has already added them)
     df = calculate_helper_columns(df)
     
     # Filter to only count main subscribers (not dependents)
     if 'RELATION' in df.columns:
         # For enrollment counts, we only count SELF (subscribers)
-        subscribers_df = df.query("RELATION == 'SELF'").copy()
+        subscribers_df = df.query("RELATION == 'SELF'")
         print(f"Filtered to {len(subscribers_df)} subscriber rows (RELATION = SELF)")
     else:
-        subscribers_df = df.copy()
+        subscribers_df = df
         print("Warning: No RELATION column found, processing all rows")
     
     # Map plan codes and benefit codes to categories with fallback
+    # (.assign returns a new frame, so the filter above needs no .copy();
+    # each distinct PLAN / benefit code is only looked up once)
+    plan_types_for = lambda plans: plans.map(PLAN_TO_TYPE).fillna(infer_plan_types(plans))
+    tiers_for = lambda codes: codes.map(BEN_CODE_TO_TIER).fillna('EE')
     subscribers_df = subscribers_df.assign(
-        plan_type=lambda x: x['PLAN'].map(PLAN_TO_TYPE).fillna(x['PLAN'].apply(infer_plan_type))
+        plan_type=lambda x: lookup_by_category(x['PLAN'], plan_types_for)
         if 'PLAN' in x.columns else 'VALUE',
-        tier=lambda x: x['CALCULATED_BEN_CODE'].map(BEN_CODE_TO_TIER).fillna('EE')
+        tier=lambda x: lookup_by_category(x['CALCULATED_BEN_CODE'], tiers_for)
         if 'CALCULATED_BEN_CODE' in x.columns 
-        else x['BEN CODE'].map(BEN_CODE_TO_TIER).fillna('EE') 
+        else lookup_by_category(x['BEN CODE'], tiers_for) 
         if 'BEN CODE' in x.columns 
         else 'EE'
     )
     
-    # Check for unmapped PLAN codes
-    if 'PLAN' in subscribers_df.columns:
+    # Check for unmapped PLAN codes (analyze_source_columns already lists
+    # them for the whole source, so this extra scan is opt-in)
+    if verbose and 'PLAN' in subscribers_df.columns:
         unmapped_plans = subscribers_df[
-            ~subscribers_df['PLAN'].isin(PLAN_TO_TYPE.keys()) & subscribers_df['PLAN'].notna()
-        ]['PLAN'].unique()
+            ~subscribers_df['PLAN'].isin(MAPPED_PLANS) & subscribers_df['PLAN'].notna()
+        ]['PLAN'].unique().tolist()
         if len(unmapped_plans) > 0:
             print(f"Warning: Found unmapped PLAN codes (defaulting to VALUE): {unmapped_plans[:10]}")
     
@@ -696,63 +864,151 @@ def process_enrollment_data(df):
         .pipe(validate_facility_codes)
     )
     
+    # Resolve the facility ID column once - prioritize CLIENT ID, the same
+    # column read_source_data used for facility matching
+    id_column = next((col for col in ID_COLUMNS if col in subscribers_df.columns), None)
+    if id_column is None:
+        raise ValueError(f"No Client ID column found (expected one of: {', '.join(ID_COLUMNS)})")
+    
+    # Count enrollments by facility, plan type and tier in one groupby,
+    # instead of filtering once per facility
+    enrollment_counts = (subscribers_df
+        .groupby([id_column, 'plan_type', 'tier'], observed=True)
+        .size()
+        .unstack(fill_value=0)
+        .reindex(columns=TIERS, fill_value=0)
+        .to_dict('index')
+    )
+    
+    return build_processed_data(enrollment_counts)
+
+def build_processed_data(enrollment_counts):
+    """
+    This function arranges the counts as tab → facility → plan → tier → count
+    for every facility in FACILITY_MAPPING
+    enrollment_counts maps (client ID, plan type) to {tier: count}
+    """
+    processed_data = {}
+    
     # Process each tab and facility
     for tab_name, facilities in FACILITY_MAPPING.items():
         processed_data[tab_name] = {}
         
         for client_id, facility_name in facilities.items():
-            # Find data for this facility - prioritize CLIENT ID
-            id_columns = ['CLIENT ID', 'CLIENT_ID', 'TPA Code', 'DEPT #']
-            facility_data = None
+            # Structure the result (zeros for plans/facilities with no data);
+            # each facility gets its own copies of the tier dicts
+            result = {plan: dict(enrollment_counts.get((client_id, plan), ZERO_TIERS))
+                      for plan in PLAN_TYPES}
             
-            for col in id_columns:
-                if col in subscribers_df.columns:
-                    try:
-                        facility_data = subscribers_df.query(f"`{col}` == @client_id").copy()
-                        if not facility_data.empty:
-                            break
-                    except:
-                        facility_data = subscribers_df[subscribers_df[col] == client_id].copy()
-                        if not facility_data.empty:
-                            break
-            
-            if facility_data is None or facility_data.empty:
-                # Default to zeros if no data found
-                processed_data[tab_name][facility_name] = {
-                    plan: {tier: 0 for tier in ['EE', 'EE & Spouse', 'EE & Child', 'EE & Children', 'EE & Family']}
-                    for plan in ['EPO', 'PPO', 'VALUE']
-                }
-                continue
-            
-            # Count enrollments by plan type and tier
-            if not facility_data.empty:
-                # Create pivot table for counts
-                enrollment_counts = (facility_data
-                    .groupby(['plan_type', 'tier'])
-                    .size()
-                    .unstack(fill_value=0)
-                    .reindex(columns=['EE', 'EE & Spouse', 'EE & Child', 'EE & Children', 'EE & Family'], fill_value=0)
-                    .to_dict('index')
-                )
-                
-                # Structure the result
-                result = {}
-                for plan in ['EPO', 'PPO', 'VALUE']:
-                    if plan in enrollment_counts:
-                        result[plan] = enrollment_counts[plan]
-                    else:
-                        result[plan] = {tier: 0 for tier in ['EE', 'EE & Spouse', 'EE & Child', 'EE & Children', 'EE & Family']}
-                
-                processed_data[tab_name][facility_name] = result
-            else:
-                # Use default zeros
-                processed_data[tab_name][facility_name] = {
-                    plan: {tier: 0 for tier in ['EE', 'EE & Spouse', 'EE & Child', 'EE & Children', 'EE & Family']}
-                    for plan in ['EPO', 'PPO', 'VALUE']
-                }
+            processed_data[tab_name][facility_name] = result
     
     return processed_data
 
+def iter_source_chunks(file_path, chunksize=100_000):
+    """
+    This function reads the main data sheet a piece at a time (chunksize rows
+    per piece, only the columns we use) instead of loading it all at once
+    With chunksize=None the whole sheet comes back as one piece
+    It streams the rows with openpyxl's read-only mode, so no cell objects
+    are built, and fills one list per column
+    """
+    wb = load_workbook(file_path, read_only=True, data_only=True)
+    try:
+        ws = wb.worksheets[0]
+        # Some programs save a wrong sheet size (A1:A1); forget it so every
+        # row and column is still read
+        try:
+            if ws.calculate_dimension() == 'A1:A1':
+                ws.reset_dimensions()
+        except ValueError:
+            pass  # No size saved at all, which openpyxl already handles
+        
+        rows = ws.iter_rows(values_only=True)
+        header = next(rows, ())
+        keep = [(i, col) for i, col in enumerate(header) if col in SOURCE_COLUMNS]
+        columns = {col: [] for _, col in keep}
+        
+        count = 0
+        for row in rows:
+            for i, col in keep:
+                columns[col].append(row[i] if i < len(row) else None)
+            count += 1
+            if count == chunksize:
+                yield pd.DataFrame(columns)
+                columns = {col: [] for _, col in keep}
+                count = 0
+        if count or chunksize is None:
+            yield pd.DataFrame(columns)
+    finally:
+        wb.close()
+
+def process_enrollment_data_chunked(file_path, chunksize=100_000):
+    """
+    This function gives the same counts as read_source_data followed by
+    process_enrollment_data, but reads the source a piece at a time, so very
+    large files never have to fit in memory at once
+    Each piece only adds to a small running tally per employee, facility and
+    plan (SELF / spouse / child rows and subscriber count); coverage tiers
+    need the whole family, so they're worked out once every piece is read
+    """
+    tally = None
+    for chunk in iter_source_chunks(file_path, chunksize):
+        # Same rows as read_source_data keeps: active, with a known facility
+        if 'STATUS' in chunk.columns:
+            chunk = chunk[is_active_status(chunk['STATUS'])]
+        id_column = next((col for col in ID_COLUMNS if col in chunk.columns), None)
+        if id_column is None:
+            raise ValueError(f"No Client ID column found (expected one of: {', '.join(ID_COLUMNS)})")
+        known = TPA_TABLE['Location'].reindex(chunk[id_column].to_numpy()).notna().to_numpy()
+        chunk = chunk[known].replace({'': np.nan})
+        if 'PLAN' not in chunk.columns:
+            chunk = chunk.assign(PLAN=np.nan)  # Counted as VALUE, as before
+        
+        # Employees are grouped the same way as calculate_helper_columns
+        employee_column = find_employee_column(chunk.columns)
+        family_keys = ['CLIENT ID'] + ([employee_column] if employee_column else [])
+        keys = list(dict.fromkeys(family_keys + [id_column, 'PLAN']))
+        
+        relation = chunk['RELATION']
+        part = (pd.DataFrame({
+                'self': relation == 'SELF',
+                'spouse': relation.isin(['SPOUSE', 'SP']),
+                'children': relation.isin(['CHILD', 'CH', 'CHILDREN'])
+            })
+            .groupby([chunk[key] for key in keys], dropna=False)
+            .sum()
+        )
+        part['subscribers'] = part['self']  # Only SELF rows are counted
+        
+        # Add this piece to the running tally
+        tally = part if tally is None else (pd.concat([tally, part])
+            .groupby(level=keys, dropna=False, sort=False).sum())
+    
+    if tally is None or tally.empty:
+        return build_processed_data({})
+    
+    # Work out each employee's benefit code from their whole family
+    family = tally.groupby(level=family_keys, dropna=False, sort=False)[['self', 'spouse', 'children']].transform('sum')
+    ben_codes = family_ben_codes(family['self'].to_numpy() > 0,
+                                 family['spouse'].to_numpy() > 0,
+                                 family['children'].to_numpy())
+    
+    plan_types_for = lambda plans: plans.map(PLAN_TO_TYPE).fillna(infer_plan_types(plans))
+    counts = pd.DataFrame({
+        id_column: tally.index.get_level_values(id_column),
+        'plan_type': lookup_by_category(pd.Series(tally.index.get_level_values('PLAN')), plan_types_for).to_numpy(),
+        'tier': pd.Series(ben_codes).map(BEN_CODE_TO_TIER).to_numpy(),
+        'subscribers': tally['subscribers'].to_numpy()
+    })
+    enrollment_counts = (counts[counts['subscribers'] > 0]
+        .groupby([id_column, 'plan_type', 'tier'])['subscribers']
+        .sum()
+        .unstack(fill_value=0)
+        .reindex(columns=TIERS, fill_value=0)
+        .to_dict('index')
+    )
+    return build_processed_data(enrollment_counts)
+
 def add_enrollment_categories(df):
     """
     This function groups facilities by size (Low/Medium/High enrollment)
@@ -763,22 +1019,22 @@ def add_enrollment_categories(df):
     This helps spot trends and verify data looks reasonable
     """
     if 'Location' in df.columns:
-        # Count enrollments per facility
-        facility_counts = df.groupby('Location').size().reset_index(name='facility_enrollment_count')
+        # Count enrollments per facility, lined up with every row in one
+        # pass (no per-facility table to merge back)
+        facility_counts = df.groupby('Location', observed=True)['Location'].transform('size')
         
         # Create size categories
-        if not facility_counts.empty and len(facility_counts) > 0:
-            facility_counts['enrollment_volume'] = pd.cut(
-                facility_counts['facility_enrollment_count'],
+        if not facility_counts.empty:
+            df = df.assign(enrollment_volume=pd.cut(
+                facility_counts,
                 bins=[0, 50, 200, float('inf')],
                 labels=['Low', 'Medium', 'High']
-            )
-            
-            # Merge back to main dataframe
-            df = df.merge(facility_counts[['Location', 'enrollment_volume']], on='Location', how='left')
+            ))
             
+            # One row per facility for the summary
+            facilities = df[['Location', 'enrollment_volume']].drop_duplicates('Location')
             print("\nEnrollment Volume Categories:")
-            print(facility_counts.groupby('enrollment_volume')['Location'].count())
+            print(facilities.groupby('enrollment_volume')['Location'].count())
     
     return df
 
@@ -791,10 +1047,8 @@ def validate_facility_codes(df):
     - Helps prevent errors before updating the final spreadsheet
     """
     if 'Location' in df.columns:
-        # Flag invalid facilities
-        df['valid_facility'] = df['Location'].notna()
-        
-        invalid_count = (~df['valid_facility']).sum()
+        # Count invalid facilities (nothing else needs a per-row flag)
+        invalid_count = df['Location'].isna().sum()
         if invalid_count > 0:
             print(f"Warning: {invalid_count} rows with invalid/missing facility codes")
     
@@ -809,9 +1063,8 @@ def analyze_source_columns(df):
     - Distribution of key fields like RELATION and PLAN
     This helps verify the data looks correct before processing
     """
-    print("\n" + "="*60)
-    print("SOURCE DATA ANALYSIS")
-    print("="*60)
+    # Collect the report and print it in one go
+    report = ["\n" + "="*60, "SOURCE DATA ANALYSIS", "="*60]
     
     # Check for Employee ID column
     emp_cols = ['EMPLOYEE ID', 'EMP ID', 'J', 'Employee_ID', 'EMPLOYEE NAME']
@@ -819,54 +1072,58 @@ def analyze_source_columns(df):
     for col in emp_cols:
         if col in df.columns:
             found_emp_col = col
-            print(f"Found Employee ID column: {col}")
-            print(f"  - Unique employees: {df[col].nunique()}")
+            report.append(f"Found Employee ID column: {col}")
+            # Distinct values in one pass; blanks are dropped from the (few)
+            # distinct values rather than from every row
+            employees = pd.unique(df[col].to_numpy())
+            report.append(f"  - Unique employees: {pd.notna(employees).sum()}")
             break
     
     if not found_emp_col:
-        print("Warning: No Employee ID column found. Using SEQ. # for grouping.")
+        report.append("Warning: No Employee ID column found. Using SEQ. # for grouping.")
     
     # Check for RELATION column
     if 'RELATION' in df.columns:
-        relation_dist = df['RELATION'].value_counts()
-        print(f"\nRELATION distribution:\n{relation_dist}")
+        relation_dist = df['RELATION'].value_counts().loc[lambda counts: counts > 0]
+        report.append(f"\nRELATION distribution:\n{relation_dist}")
     else:
-        print("\nNo 'RELATION' column found")
+        report.append("\nNo 'RELATION' column found")
     
     # Check for PLAN column and validate against mapping
     if 'PLAN' in df.columns:
-        plans = df['PLAN'].value_counts().head(20)
-        print("\nTop PLAN values found:")
-        print(plans)
+        # Only the top 20 are shown, so skip sorting the full count table
+        plans = df['PLAN'].value_counts(sort=False).loc[lambda counts: counts > 0].nlargest(20)
+        report.append("\nTop PLAN values found:")
+        report.append(str(plans))
         
-        # Check which plans are mapped
-        unmapped_plans = df[~df['PLAN'].isin(PLAN_TO_TYPE.keys()) & df['PLAN'].notna()]['PLAN'].unique()
+        # Check which plans are mapped (each distinct code checked once)
+        plans_seen = pd.unique(df['PLAN'].dropna())
+        unmapped_plans = [plan for plan in plans_seen if plan not in PLAN_TO_TYPE]
         if len(unmapped_plans) > 0:
-            print(f"\nUnmapped PLAN codes found: {unmapped_plans[:10]}")
-            print("These will default to VALUE")
+            report.append(f"\nUnmapped PLAN codes found: {unmapped_plans[:10]}")
+            report.append("These will default to VALUE")
         
-        # Show distribution of plan types
-        df['plan_type_temp'] = df['PLAN'].map(PLAN_TO_TYPE).fillna('VALUE')
-        plan_dist = df['plan_type_temp'].value_counts()
-        print(f"\nPlan Type Distribution:\n{plan_dist}")
-        df.drop('plan_type_temp', axis=1, inplace=True)
+        # Show distribution of plan types (without adding a column to df)
+        plan_dist = df['PLAN'].map(PLAN_TO_TYPE).fillna('VALUE').rename('plan_type').value_counts()
+        report.append(f"\nPlan Type Distribution:\n{plan_dist}")
     else:
-        print("\nNo 'PLAN' column found in source data")
+        report.append("\nNo 'PLAN' column found in source data")
     
     # Check for BEN CODE column
     if 'BEN CODE' in df.columns:
-        ben_codes = df['BEN CODE'].value_counts().head(20)
-        print("\nBEN CODE values found (will be overridden by CALCULATED_BEN_CODE):")
-        print(ben_codes)
+        ben_codes = df['BEN CODE'].value_counts(sort=False).loc[lambda counts: counts > 0].nlargest(20)
+        report.append("\nBEN CODE values found (will be overridden by CALCULATED_BEN_CODE):")
+        report.append(str(ben_codes))
     
     # Show all columns in the source data
-    print(f"\nAll columns in source data ({len(df.columns)} total):")
+    report.append(f"\nAll columns in source data ({len(df.columns)} total):")
     for i, col in enumerate(df.columns, 1):
-        print(f"  {i:2}. {col}")
+        report.append(f"  {i:2}. {col}")
     
-    print("\n" + "="*60)
+    report.append("\n" + "="*60)
+    print("\n".join(report))
 
-def validate_and_summarize_data(df, processed_data):
+def validate_and_summarize_data(df, processed_data, enrollments=None):
     """
     This function validates the processed data and creates a summary
     It's like a final quality check before saving:
@@ -874,58 +1131,95 @@ def validate_and_summarize_data(df, processed_data):
     - Shows totals by facility group
     - Identifies any potential issues
     - Creates a summary table for easy review
+    Pass the table from flatten_processed_data as enrollments to reuse it
     """
-    print("\n" + "="*60)
-    print("DATA VALIDATION AND SUMMARY")
-    print("="*60)
+    # Collect the report and print it in one go
+    report = ["\n" + "="*60, "DATA VALIDATION AND SUMMARY", "="*60]
     
     # Show relation distribution
     if 'RELATION' in df.columns:
-        relation_summary = df['RELATION'].value_counts()
-        print(f"\nRelation Distribution:\n{relation_summary}")
+        relation_summary = df['RELATION'].value_counts().loc[lambda counts: counts > 0]
+        report.append(f"\nRelation Distribution:\n{relation_summary}")
     
     # Show Legacy vs California cross-tabulation
     if 'Legacy' in df.columns and 'California' in df.columns:
         cross_tab = pd.crosstab(df['Legacy'], df['California'], margins=True)
-        print(f"\nLegacy vs California Cross-Tab:\n{cross_tab}")
+        report.append(f"\nLegacy vs California Cross-Tab:\n{cross_tab}")
     
-    # Show unique value counts
-    unique_counts = df.select_dtypes(include=['object']).nunique()
-    print(f"\nUnique Value Counts:\n{unique_counts.head(10)}")
+    # Show unique value counts (text columns, including those stored as categories)
+    unique_counts = df.select_dtypes(include=['object', 'category']).nunique()
+    report.append(f"\nUnique Value Counts:\n{unique_counts.head(10)}")
     
-    # Show memory usage
-    memory = df.memory_usage(deep=True).sum() / 1024**2  # Convert to MB
-    print(f"\nTotal memory usage: {memory:.2f} MB")
+    # Show memory usage (measuring every text value is slow, so the exact
+    # figure is only worked out when ENROLLMENT_VERBOSE is set)
+    if os.environ.get('ENROLLMENT_VERBOSE'):
+        memory = df.memory_usage(deep=True).sum() / 1024**2  # Convert to MB
+        report.append(f"\nTotal memory usage: {memory:.2f} MB")
+    else:
+        memory = df.memory_usage(deep=False).sum() / 1024**2  # Convert to MB
+        report.append(f"\nTotal memory usage: {memory:.2f} MB (approx)")
     
     # Summary of processed enrollments by tab
-    print("\n" + "-"*40)
-    print("ENROLLMENT SUMMARY BY TAB")
-    print("-"*40)
+    report.append("\n" + "-"*40)
+    report.append("ENROLLMENT SUMMARY BY TAB")
+    report.append("-"*40)
     
-    tab_summary = []
-    for tab, facilities in processed_data.items():
-        total_epo = sum(sum(plans.get('EPO', {}).values()) for plans in facilities.values())
-        total_ppo = sum(sum(plans.get('PPO', {}).values()) for plans in facilities.values())
-        total_value = sum(sum(plans.get('VALUE', {}).values()) for plans in facilities.values())
-        if total_epo + total_ppo + total_value > 0:
-            tab_summary.append({
-                'Tab': tab,
-                'Facilities': len(facilities),
-                'EPO Enrollments': total_epo,
-                'PPO Enrollments': total_ppo,
-                'VALUE Enrollments': total_value,
-                'Total': total_epo + total_ppo + total_value
-            })
+    # Total each tab's enrollments per plan type in one groupby over the
+    # flattened counts (only tabs with enrollments are listed)
+    if enrollments is None:
+        enrollments = flatten_processed_data(processed_data)
+    totals = (enrollments
+        .groupby(['Tab', 'Plan Type'], sort=False)['Count'].sum()
+        .unstack(fill_value=0)
+        .reindex(columns=PLAN_TYPES, fill_value=0)
+    )
+    totals = totals[totals.sum(axis=1) > 0]
     
-    if tab_summary:
-        summary_df = pd.DataFrame(tab_summary)
-        print(summary_df.to_string(index=False))
-        print(f"\nGrand Total: {summary_df['Total'].sum()} enrollments")
+    if not totals.empty:
+        summary_df = pd.DataFrame({
+            'Tab': totals.index,
+            'Facilities': [len(processed_data[tab]) for tab in totals.index],
+            'EPO Enrollments': totals['EPO'].to_numpy(),
+            'PPO Enrollments': totals['PPO'].to_numpy(),
+            'VALUE Enrollments': totals['VALUE'].to_numpy(),
+            'Total': totals.sum(axis=1).to_numpy()
+        })
+        report.append(summary_df.to_string(index=False))
+        report.append(f"\nGrand Total: {summary_df['Total'].sum()} enrollments")
+        print("\n".join(report))
         return summary_df
     
+    print("\n".join(report))
     return pd.DataFrame()
 
-def export_summary_report(processed_data, output_file='enrollment_summary.csv'):
+# Columns of the flat enrollment table and the exported summary report
+ENROLLMENT_COLUMNS = ['Tab', 'Facility', 'Plan Type', 'Enrollment Tier', 'Count']
+
+def iter_enrollment_rows(processed_data):
+    """
+    This function walks the nested processed data (tab → facility → plan →
+    tier → count) and yields one (tab, facility, plan, tier, count) row per
+    non-zero count, without building a list of them first
+    """
+    for tab, facilities in processed_data.items():
+        for facility, plans in facilities.items():
+            for plan_type, tiers in plans.items():
+                for tier, count in tiers.items():
+                    if count > 0:  # Only include non-zero enrollments
+                        yield (tab, facility, plan_type, tier, count)
+
+def flatten_processed_data(processed_data):
+    """
+    This function turns the nested processed data into a flat table with one
+    row per non-zero count
+    Both the validation summary and the exported report are built from it
+    """
+    return pd.DataFrame.from_records(
+        list(iter_enrollment_rows(processed_data)), columns=ENROLLMENT_COLUMNS
+    )
+
+def export_summary_report(processed_data, output_file='enrollment_summary.csv', enrollments=None,
+                          show_pivot=True):
     """
     This function creates a detailed summary report you can open in Excel
     The report shows:
@@ -934,57 +1228,108 @@ def export_summary_report(processed_data, output_file='enrollment_summary.csv'):
     - Breakdown by coverage tier (Employee only, Family, etc.)
     
     Use this to double-check the numbers before finalizing
+    Pass the table from flatten_processed_data as enrollments to reuse it;
+    without one the report is written straight from processed_data row by
+    row, and only read back into a table if show_pivot is on
     """
-    rows = []
-    for tab, facilities in processed_data.items():
-        for facility, plans in facilities.items():
-            for plan_type, tiers in plans.items():
-                for tier, count in tiers.items():
-                    if count > 0:  # Only include non-zero enrollments
-                        rows.append({
-                            'Tab': tab,
-                            'Facility': facility,
-                            'Plan Type': plan_type,
-                            'Enrollment Tier': tier,
-                            'Count': count
-                        })
-    
-    if rows:
-        summary_df = pd.DataFrame(rows)
-        
+    if enrollments is not None:
+        if enrollments.empty:
+            print("No enrollment data to export")
+            return pd.DataFrame()
         # Save to CSV
-        summary_df.to_csv(output_file, index=False, encoding='utf-8-sig')
+        enrollments.to_csv(output_file, index=False, encoding='utf-8-sig')
+        summary_df = enrollments
+    else:
+        rows = iter_enrollment_rows(processed_data)
+        first_row = next(rows, None)
+        if first_row is None:
+            print("No enrollment data to export")
+            return pd.DataFrame()
+        # Stream the rows to CSV (same layout and line endings as to_csv)
+        with open(output_file, 'w', newline='', encoding='utf-8-sig') as f:
+            writer = csv.writer(f, lineterminator=os.linesep)
+            writer.writerow(ENROLLMENT_COLUMNS)
+            writer.writerow(first_row)
+            writer.writerows(rows)
+        summary_df = None
+    
+    print(f"\nSummary report exported to {output_file}")
+    
+    if show_pivot:
+        if summary_df is None:
+            # Keep text columns as text (facility codes can look like numbers)
+            summary_df = pd.read_csv(
+                output_file, encoding='utf-8-sig', keep_default_na=False,
+                dtype={col: str for col in ENROLLMENT_COLUMNS[:-1]}
+            )
         
-        # Create a pivot table view for easier reading
-        pivot = summary_df.pivot_table(
-            index=['Tab', 'Facility'],
-            columns=['Plan Type', 'Enrollment Tier'],
-            values='Count',
-            fill_value=0,
-            aggfunc='sum'
+        # Create a pivot table view for easier reading (each tab, facility,
+        # plan and tier appears once, so this is a reshape - nothing to add up)
+        pivot = (summary_df
+            .set_index(ENROLLMENT_COLUMNS[:-1])['Count']
+            .unstack(['Plan Type', 'Enrollment Tier'], fill_value=0)
+            .sort_index()
+            .sort_index(axis=1)
         )
-        
-        print(f"\nSummary report exported to {output_file}")
         print(f"Pivot view:\n{pivot.head(10)}")
-        
-        return summary_df
+    
+    return summary_df if summary_df is not None else pd.DataFrame()
+
+def cell_value(ws, row, column):
+    """
+    This function reads one cell's value from a tab
+    Unlike ws.cell(), it doesn't add empty cells to the tab just by looking
+    at them, so searching the template doesn't grow the file that gets saved
+    """
+    cells = getattr(ws, '_cells', None)
+    if cells is None:
+        return ws.cell(row=row, column=column).value
+    cell = cells.get((row, column))
+    return cell.value if cell is not None else None
+
+def index_sheet_labels(ws, max_row=1000, max_col=10):
+    """
+    This function lists the filled-in cells near the left edge of a tab
+    (rows before max_row, columns before max_col) in reading order, row by
+    row, as (row, column, value)
+    Building it once per tab means each facility or section search is a
+    quick scan of this list instead of thousands of cell lookups
+    """
+    # Work out the search area once (ws.max_column walks every cell)
+    last_row = min(max_row, ws.max_row + 1)
+    last_col = min(max_col, ws.max_column + 1)
+    
+    cells = getattr(ws, '_cells', None)
+    if cells is None:
+        rows = ws.iter_rows(min_row=1, max_row=last_row - 1, max_col=last_col - 1, values_only=True)
+        values = ((row, col, value)
+                  for row, row_values in enumerate(rows, start=1)
+                  for col, value in enumerate(row_values, start=1))
     else:
-        print("No enrollment data to export")
-        return pd.DataFrame()
+        # Read the sheet's cell store directly so no empty cells are created
+        values = ((row, col, cell.value) for (row, col), cell in sorted(cells.items())
+                  if row < last_row and col < last_col)
+    return [(row, col, value) for row, col, value in values if value]
 
-def find_facility_location(ws, facility_name, start_row=1, max_row=1000):
+def find_facility_location(ws, facility_name, start_row=1, max_row=1000, labels=None):
     """
     This function searches through an Excel tab to find where a facility's data begins
     It's like using Excel's "Find" feature (Ctrl+F) to locate text
     
     For example, it finds where "Chino Valley Medical Center" appears in the template
     so we know exactly where to place the enrollment numbers
+    
+    Pass the tab's index_sheet_labels() list as labels when searching
+    the same tab for many facilities
     """
-    for row in range(start_row, min(max_row, ws.max_row + 1)):
-        for col in range(1, min(10, ws.max_column + 1)):  # Check first 10 columns
-            cell_value = ws.cell(row=row, column=col).value
-            if cell_value and facility_name in str(cell_value):
-                return row, col
+    if labels is None:
+        labels = index_sheet_labels(ws, max_row=max_row)
+    
+    for row, col, value in labels[bisect_left(labels, (start_row,)):]:
+        if row >= max_row:
+            break
+        if col < 10 and facility_name in str(value):  # Check first 10 columns
+            return row, col
     return None, None
 
 def update_destination_file(destination_path, processed_data, output_path=None):
@@ -1005,10 +1350,16 @@ def update_destination_file(destination_path, processed_data, output_path=None):
             continue
             
         ws = wb[tab_name]
+        # One list of the tab's labels (first 10 columns) serves every
+        # facility and section search, so scanning touches no cells
+        labels = index_sheet_labels(ws, max_row=ws.max_row + 1, max_col=11)
+        section_labels = uppercase_labels(labels)
+        # Enrollment numbers for this tab, written once every facility is done
+        writes = {}
         
         for facility_name, plan_data in facilities_data.items():
             # Find where this facility's section starts
-            facility_row, facility_col = find_facility_location(ws, facility_name)
+            facility_row, facility_col = find_facility_location(ws, facility_name, labels=labels)
             
             if not facility_row:
                 print(f"Warning: Could not find '{facility_name}' in tab '{tab_name}'")
@@ -1020,23 +1371,16 @@ def update_destination_file(destination_path, processed_data, output_path=None):
             print(f"  Found '{facility_name}' at {get_column_letter(facility_col)}{facility_row}")
             print(f"    -> Will place enrollments in column {get_column_letter(enrollment_col)}")
             
-            # Find and update EPO section
-            epo_row = find_section_start(ws, facility_row, ('EPO',))
-            if epo_row and 'EPO' in plan_data:
-                print(f"    -> EPO enrollments starting at row {epo_row}")
-                update_plan_section_by_position(ws, epo_row, enrollment_col, plan_data['EPO'])
-            
-            # Find and update PPO section if exists
-            ppo_row = find_section_start(ws, facility_row, ('PPO',))
-            if ppo_row and 'PPO' in plan_data:
-                print(f"    -> PPO enrollments starting at row {ppo_row}")
-                update_plan_section_by_position(ws, ppo_row, enrollment_col, plan_data['PPO'])
-            
-            # Find and update VALUE section
-            value_row = find_section_start(ws, facility_row, ('VALUE',))
-            if value_row and 'VALUE' in plan_data:
-                print(f"    -> VALUE enrollments starting at row {value_row}")
-                update_plan_section_by_position(ws, value_row, enrollment_col, plan_data['VALUE'])
+            # Find where the EPO, PPO and VALUE sections start in one scan
+            section_rows = find_sections(ws, facility_row, PLAN_TYPES, upper_labels=section_labels)
+            for plan_type in PLAN_TYPES:
+                section_row = section_rows[plan_type]
+                if section_row and plan_type in plan_data:
+                    print(f"    -> {plan_type} enrollments starting at row {section_row}")
+                    update_plan_section_by_position(ws, section_row, enrollment_col, plan_data[plan_type], writes)
+        
+        # Write every collected number into the tab at once
+        write_cells(ws, writes)
     
     # Save the updated workbook
     if output_path:
@@ -1046,24 +1390,79 @@ def update_destination_file(destination_path, processed_data, output_path=None):
     
     print(f"Successfully updated enrollment data!")
 
-def find_section_start(ws, anchor_row, keywords=('EPO',)):
+def find_section_start(ws, anchor_row, keywords=('EPO',), labels=None):
     """
     This function finds where a section (EPO, PPO, VALUE) starts in the template
     It searches from the anchor_row down about 25 rows, across the first 10 columns
     for any of the specified keywords.
+    Pass the tab's index_sheet_labels() list (covering 10 columns) as labels
+    to search it instead of the cells
     """
+    if labels is not None:
+        for row, col, val in labels[bisect_left(labels, (anchor_row,)):]:
+            if row > anchor_row + 25:
+                break
+            if isinstance(val, str) and any(k in val.upper() for k in keywords):
+                return row
+        return None
+    
     # Search from anchor_row down ~25 rows, across first 10 columns
     max_r = min(ws.max_row, anchor_row + 25)
     max_c = min(ws.max_column, 10)
     
     for r in range(anchor_row, max_r + 1):
         for c in range(1, max_c + 1):
-            val = ws.cell(row=r, column=c).value
+            val = cell_value(ws, r, c)
             if isinstance(val, str) and any(k in val.upper() for k in keywords):
                 return r
     return None
 
-def update_plan_section_by_position(ws, start_row, col, tier_data):
+def uppercase_labels(labels):
+    """
+    This function keeps only the text labels from index_sheet_labels(),
+    upper-cased once, for the case-insensitive section searches
+    """
+    return [(row, col, value.upper()) for row, col, value in labels if isinstance(value, str)]
+
+def find_sections(ws, anchor_row, keywords=('EPO', 'PPO', 'VALUE'), labels=None, upper_labels=None):
+    """
+    This function finds where several sections start in one pass
+    It searches the same area as find_section_start (anchor_row down about
+    25 rows, first 10 columns) and returns {keyword: first row containing it},
+    with None for any keyword that isn't found
+    Pass the tab's index_sheet_labels() list (covering 10 columns) as labels
+    to search it instead of the cells, or its uppercase_labels() as
+    upper_labels to also skip upper-casing when searching many facilities
+    """
+    found = dict.fromkeys(keywords)
+    
+    if upper_labels is not None:
+        cells = upper_labels[bisect_left(upper_labels, (anchor_row,)):]
+    elif labels is not None:
+        cells = labels[bisect_left(labels, (anchor_row,)):]
+    else:
+        max_r = min(ws.max_row, anchor_row + 25)
+        max_c = min(ws.max_column, 10)
+        cells = ((r, c, cell_value(ws, r, c))
+                 for r in range(anchor_row, max_r + 1) for c in range(1, max_c + 1))
+    
+    missing = len(found)
+    for row, col, val in cells:
+        if row > anchor_row + 25:
+            break
+        if not isinstance(val, str):
+            continue
+        # Upper-case each label once for every keyword
+        text = val if upper_labels is not None else val.upper()
+        for keyword in keywords:
+            if found[keyword] is None and keyword in text:
+                found[keyword] = row
+                missing -= 1
+        if missing == 0:
+            break
+    return found
+
+def update_plan_section_by_position(ws, start_row, col, tier_data, writes=None):
     """
     This function fills in the actual enrollment numbers in the template
     It knows that:
@@ -1074,39 +1473,43 @@ def update_plan_section_by_position(ws, start_row, col, tier_data):
     - Row 5 = Employee + Family count
     
     It places each number in exactly the right cell
+    Pass a writes dict to collect the numbers as {(row, column): value}
+    instead of writing them, then save them with write_cells()
     """
-    # Map tier names to their row positions
-    tier_rows = {
-        'EE': 0,
-        'EE & Spouse': 1,
-        'EE & Child': 2,
-        'EE & Children': 3,
-        'EE & Family': 4
-    }
+    def current(row, column):
+        # Numbers collected earlier count as already written
+        if writes is not None and (row, column) in writes:
+            return writes[(row, column)]
+        return cell_value(ws, row, column)
+    
+    def put(row, column, value):
+        if writes is not None:
+            writes[(row, column)] = value
+        else:
+            ws.cell(row=row, column=column).value = value
     
     # Check if template uses combined Child/Children format
     tier_label_col = col - 1  # Usually one column left of enrollment numbers
-    row2_label = ws.cell(row=start_row + 2, column=tier_label_col).value
-    
-    if row2_label and 'Child(ren)' in str(row2_label):
-        # Combined format: 4 tiers total instead of 5
-        tier_rows = {
-            'EE': 0,
-            'EE & Spouse': 1,
-            'EE & Child': 2,  # Combined with Children
-            'EE & Children': 2,  # Combined with Child
-            'EE & Family': 3
-        }
-    
-    for tier, row_offset in tier_rows.items():
+    row2_label = current(start_row + 2, tier_label_col)
+    combined = bool(row2_label) and 'Child(ren)' in str(row2_label)
+    
+    for tier, row_offset in (TIER_ROWS_4 if combined else TIER_ROWS_5):
         if tier in tier_data:
             # Update the enrollment count at the calculated position
-            current_value = ws.cell(row=start_row + row_offset, column=col).value or 0
+            row = start_row + row_offset
             # If Child and Children map to same row, add them together
-            if tier == 'EE & Children' and row_offset == tier_rows.get('EE & Child', -1):
-                ws.cell(row=start_row + row_offset, column=col).value = current_value + tier_data[tier]
+            if combined and tier == 'EE & Children':
+                put(row, col, (current(row, col) or 0) + tier_data[tier])
             else:
-                ws.cell(row=start_row + row_offset, column=col).value = tier_data[tier]
+                put(row, col, tier_data[tier])
+
+def write_cells(ws, writes):
+    """
+    This function saves the numbers collected by update_plan_section_by_position
+    into the tab in one pass, going through the cells row by row
+    """
+    for (row, column), value in sorted(writes.items()):
+        ws.cell(row=row, column=column).value = value
 
 def main():
     """
@@ -1147,14 +1550,15 @@ def main():
         # Step 2: Process and count enrollments
         print("\nStep 2: Processing enrollment data...")
         processed_data = process_enrollment_data(source_df)
+        enrollments = flatten_processed_data(processed_data)
         
         # Step 3: Validate and summarize the data
         print("\nStep 3: Validating data...")
-        summary_df = validate_and_summarize_data(source_df, processed_data)
+        summary_df = validate_and_summarize_data(source_df, processed_data, enrollments)
         
         # Step 4: Export summary report for review
         print("\nStep 4: Exporting summary report...")
-        export_summary_report(processed_data, summary_file)
+        export_summary_report(processed_data, summary_file, enrollments)
         
         # Step 5: Update destination file with enrollment counts
         print("\nStep 5: Updating destination file...")
@@ -397,13 +397,34 @@ def read_and_prepare_data(file_path):
     """
     Read source data and prepare for processing
     """
-    df = pd.read_excel(file_path, sheet_name=0)
+    # Stream the first sheet and drop inactive rows before building the frame
+    wb = load_workbook(file_path, read_only=True, data_only=True)
+    ws = wb.worksheets[0]
+    # Some programs save a wrong sheet size (A1:A1); forget it so every
+    # row and column is still read (pd.read_excel does the same)
+    try:
+        if ws.calculate_dimension() == 'A1:A1':
+            ws.reset_dimensions()
+    except ValueError:
+        pass  # No size saved at all, which openpyxl already handles
+    rows = ws.iter_rows(values_only=True)
+    header = list(next(rows, ()))
     
-    # Filter to active only
-    if 'STATUS' in df.columns:
-        original_count = len(df)
-        df = df[df['STATUS'].astype(str).str.upper() == 'A'].copy()
+    if 'STATUS' in header:
+        status_idx = header.index('STATUS')
+        original_count = 0
+        active_rows = []
+        for row in rows:
+            if not any(v is not None for v in row):
+                continue
+            original_count += 1
+            if str(row[status_idx]).upper() == 'A':
+                active_rows.append(row)
+        df = pd.DataFrame(active_rows, columns=header)
         print(f"Filtered to {len(df)} active rows (STATUS='A') from {original_count} total")
+    else:
+        df = pd.DataFrame([row for row in rows if any(v is not None for v in row)], columns=header)
+    wb.close()
     
     # Add facility info
     if 'CLIENT ID' in df.columns:
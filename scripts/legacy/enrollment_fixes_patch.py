@@ -107,19 +107,17 @@ def process_enrollment_data(df):
     
     # Validate tier integrity - ensure no collapse
     if 'tier' in subscribers_df.columns:
-        facilities_with_single_tier = []
-        for facility_id in subscribers_df['CLIENT ID'].unique():
-            facility_data = subscribers_df[subscribers_df['CLIENT ID'] == facility_id]
-            unique_tiers = facility_data['tier'].nunique()
-            if unique_tiers == 1 and len(facility_data) > 10:  # Only flag if >10 employees
-                facilities_with_single_tier.append(facility_id)
+        # One groupby pass instead of a boolean mask per facility
+        tier_stats = subscribers_df.groupby('CLIENT ID', sort=False)['tier'].agg(
+            count='size', nunique='nunique', first='first'
+        )
+        # Only flag if >10 employees
+        facilities_with_single_tier = tier_stats[(tier_stats['count'] > 10) & (tier_stats['nunique'] == 1)]
         
-        if facilities_with_single_tier:
+        if not facilities_with_single_tier.empty:
             print(f"\nWarning: {len(facilities_with_single_tier)} facilities have all enrollments in single tier:")
-            for fid in facilities_with_single_tier[:5]:  # Show first 5
-                tier = subscribers_df[subscribers_df['CLIENT ID'] == fid]['tier'].iloc[0]
-                count = len(subscribers_df[subscribers_df['CLIENT ID'] == fid])
-                print(f"  - {fid}: {count} employees all in '{tier}'")
+            for fid, stats in facilities_with_single_tier.head(5).iterrows():  # Show first 5
+                print(f"  - {fid}: {stats['count']} employees all in '{stats['first']}'")
     
     # Continue with existing facility processing logic...
     # (rest of function remains similar but uses normalized 'tier' column)
@@ -21,6 +21,8 @@ Version: 1.0
 
 import pandas as pd
 import numpy as np
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 from typing import Dict, List, Optional, Tuple, Union
 import warnings
 
@@ -303,6 +305,27 @@ def build_facility_summary(
     return df_enriched, df_summary_full, df_summary_filtered
 
 
+def _process_sheet(sheet_name: str, **kwargs):
+    """
+    Process one sheet for process_all_enrollment_tabs.
+
+    Runs in a worker process, so errors are returned rather than raised to keep
+    the remaining sheets going.
+
+    Returns:
+        Tuple of (sheet_name, result, error) where exactly one of result/error is None
+    """
+    try:
+        result = build_facility_summary(
+            sheet_name=sheet_name,
+            facility_group=sheet_name if sheet_name != "Cleaned use this one" else "Centinela",
+            **kwargs
+        )
+        return sheet_name, result, None
+    except Exception as e:
+        return sheet_name, None, e
+
+
 def process_all_enrollment_tabs(
     excel_path: str,
     facility_map=None,
@@ -310,14 +333,16 @@ def process_all_enrollment_tabs(
     facility_key_col: str = "CLIENT ID", 
     plan_type_col: str = "PLAN",
     measure_col: str | None = None,
-    verbose: bool = True
+    verbose: bool = True,
+    max_workers: int | None = 1
 ) -> Dict[str, Tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]]:
     """
     Process enrollment data for all facility tabs in the Excel file.
 
     This function processes multiple worksheets in an Excel file, applying the same
-    data processing logic to each sheet. It handles errors gracefully and returns
-    results for successfully processed sheets.
+    data processing logic to each sheet. Sheets are independent, so they can
+    optionally be processed in parallel worker processes. It handles errors gracefully
+    and returns results for successfully processed sheets.
 
     Args:
         excel_path: Path to the Excel file
@@ -327,6 +352,10 @@ def process_all_enrollment_tabs(
         plan_type_col: Column name containing plan type codes
         measure_col: Column to aggregate (None for contract counting)
         verbose: Whether to print progress messages
+        max_workers: Number of worker processes (1, the default, processes sheets
+            sequentially in this process; None uses one per CPU). Worker processes
+            re-import the calling script on Windows/macOS, so only pass a value
+            other than 1 from code guarded by ``if __name__ == "__main__":``
 
     Returns:
         Dictionary with sheet names as keys and processing results as values.
@@ -348,33 +377,37 @@ def process_all_enrollment_tabs(
     results = {}
     successful_count = 0
 
-    for sheet_name in sheet_names:
-        try:
-            if verbose:
-                print(f"Processing sheet: {sheet_name}")
-
-            # Process each sheet
-            enriched, full_summary, filtered_summary = build_facility_summary(
-                excel_path=excel_path,
-                sheet_name=sheet_name,
-                facility_key_col=facility_key_col,
-                plan_type_col=plan_type_col,
-                measure_col=measure_col,
-                facility_map=facility_map,
-                plan_map=plan_map,
-                facility_group=sheet_name if sheet_name != "Cleaned use this one" else "Centinela"
-            )
-
-            results[sheet_name] = (enriched, full_summary, filtered_summary)
+    process_sheet = partial(
+        _process_sheet,
+        excel_path=excel_path,
+        facility_key_col=facility_key_col,
+        plan_type_col=plan_type_col,
+        measure_col=measure_col,
+        facility_map=facility_map,
+        plan_map=plan_map
+    )
+
+    if verbose:
+        print(f"Processing {len(sheet_names)} sheets")
+
+    if max_workers == 1:
+        outcomes = map(process_sheet, sheet_names)
+    else:
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            outcomes = list(executor.map(process_sheet, sheet_names))
+
+    for sheet_name, result, error in outcomes:
+        if error is None:
+            enriched, full_summary, filtered_summary = result
+            results[sheet_name] = result
             successful_count += 1
 
             if verbose:
                 print(f"✓ Successfully processed {sheet_name}: {len(enriched)} total records, "
                       f"{len(full_summary)} summary records")
-
-        except Exception as e:
+        else:
             if verbose:
-                print(f"✗ Error processing sheet '{sheet_name}': {str(e)}")
+                print(f"✗ Error processing sheet '{sheet_name}': {str(error)}")
             results[sheet_name] = None
 
     if verbose:
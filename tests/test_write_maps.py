@@ -0,0 +1,99 @@
+"""
+Write Map Structure Tests
+=========================
+
+Guards the static write maps consumed by the write-back step: every sheet
+in the allowlist must be present and every block must map its tiers onto
+distinct cells.
+"""
+
+import unittest
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from openpyxl.utils.cell import coordinate_to_tuple
+
+from write_maps import (
+    SHEET_WRITE_MAPS, ALLOWED_TABS, Block,
+    BLOCKS_BY_CLIENT, BLOCK_BY_ID, SHEET_OF_BLOCK, get_block, block_at,
+    get_write_map
+)
+
+
+class TestWriteMaps(unittest.TestCase):
+    """Test suite for write map definitions"""
+
+    def test_all_allowed_tabs_present(self):
+        """Every allowlisted tab has a write map"""
+        self.assertEqual(set(SHEET_WRITE_MAPS), set(ALLOWED_TABS))
+
+    def test_entries_are_blocks(self):
+        """Entries expose fields by attribute and cells as (tier, cell) pairs"""
+        entry = SHEET_WRITE_MAPS['Legacy'][0]
+        self.assertIsInstance(entry, Block)
+        self.assertEqual(entry.client_id, 'H3170')
+        self.assertEqual(entry.plan, 'EPO')
+        self.assertEqual(dict(entry.cells)['EE Only'], 'G4')
+
+    def test_get_write_map_is_cached(self):
+        """Sheets expand once and are shared with SHEET_WRITE_MAPS"""
+        self.assertIs(get_write_map('Knapp'), get_write_map('Knapp'))
+        self.assertIs(SHEET_WRITE_MAPS['Knapp'], get_write_map('Knapp'))
+        with self.assertRaises(KeyError):
+            SHEET_WRITE_MAPS['Not A Sheet']
+
+    def test_cells_unique_per_sheet(self):
+        """No two blocks on a sheet write to the same cell"""
+        for sheet_name, write_map in SHEET_WRITE_MAPS.items():
+            cells = [cell for entry in write_map for _, cell in entry.cells]
+            self.assertEqual(len(cells), len(set(cells)),
+                             f"{sheet_name} has overlapping cells")
+
+    def test_cells_rc_match_cell_refs(self):
+        """Pre-parsed (row, col) pairs agree with the cell references"""
+        for write_map in SHEET_WRITE_MAPS.values():
+            for entry in write_map:
+                parsed = tuple(coordinate_to_tuple(cell) for _, cell in entry.cells)
+                self.assertEqual(entry.cells_rc, parsed, entry.block_id)
+
+    def test_get_block(self):
+        """Blocks resolve by (sheet, client, plan, block_id) in one probe"""
+        entry = get_block('Encino-Garden Grove', 'H3250', 'EPO', 'ENC_EN_EPO_2')
+        self.assertEqual(entry.label, 'PRIME SEIU 121 RN EPO PLAN')
+        self.assertIsNone(get_block('Legacy', 'H3250', 'EPO', 'ENC_EN_EPO_2'))
+
+    def test_blocks_by_client_keeps_sheet_order(self):
+        """Multi-block clients list their blocks in sheet order"""
+        block_ids = [e.block_id for e in BLOCKS_BY_CLIENT[("St Michael's", 'H3530')]]
+        self.assertEqual(block_ids[0], 'STM_SM_EPO_JNESO')
+        self.assertEqual(block_ids[-1], 'STM_SM_VAL')
+        self.assertEqual(len(block_ids), 6)
+
+    def test_block_by_id(self):
+        """Block ids resolve directly to their entry and sheet"""
+        entry = BLOCK_BY_ID['LWB_LB_EPO_PASNAP']
+        self.assertEqual(entry.client_id, 'H3330')
+        self.assertEqual(SHEET_OF_BLOCK['LWB_LB_EPO_PASNAP'], 'Lower Bucks')
+        self.assertEqual(len(BLOCK_BY_ID), sum(len(m) for m in SHEET_WRITE_MAPS.values()))
+
+    def test_block_at(self):
+        """Cells resolve to their owning block; gaps and other columns do not"""
+        self.assertEqual(block_at('Legacy', 'G4'), 'LEG_SD_EPO')
+        self.assertEqual(block_at('Legacy', 'G7'), 'LEG_SD_EPO')
+        self.assertIsNone(block_at('Legacy', 'G8'))
+        self.assertEqual(block_at('Legacy', 'G296'), 'LEG_SMG_VAL')
+        self.assertIsNone(block_at('Legacy', 'D4'))
+        self.assertEqual(block_at('North Vista', 'D14'), 'NVI_NV_VAL')
+
+    def test_maps_are_read_only(self):
+        """Shared maps cannot be mutated by consumers"""
+        with self.assertRaises(TypeError):
+            SHEET_WRITE_MAPS['Legacy'] = ()
+        with self.assertRaises(AttributeError):
+            SHEET_WRITE_MAPS['Legacy'][0].plan = 'PPO'
+        self.assertIsInstance(SHEET_WRITE_MAPS['Legacy'], tuple)
+
+
+if __name__ == '__main__':
+    unittest.main()